@@ -23,9 +23,15 @@ from __future__ import annotations
 
 import json
 import random
-import re
 from typing import Any, Dict, List, Optional
 
+from .http_session import get_session
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON decoder – fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -46,8 +52,18 @@ REQUIRED_KEYS = [
     "enemies",
 ]
 
-# Keys that must be lists
-_LIST_KEYS = ["main_story_beats", "quests", "characters", "factions", "locations", "items", "enemies"]
+# Expected top-level type of each required key: (key, type, name for errors)
+_KEY_TYPES = (
+    ("world", str, "string"),
+    ("premise", str, "string"),
+    ("main_story_beats", list, "list"),
+    ("quests", list, "list"),
+    ("characters", list, "list"),
+    ("factions", list, "list"),
+    ("locations", list, "list"),
+    ("items", list, "list"),
+    ("enemies", list, "list"),
+)
 
 # Keys that must be dicts (or list of dicts; world/premise are strings here)
 _DICT_KEYS: List[str] = []
@@ -149,7 +165,9 @@ def generate_idle_rpg_design(
 
     url = f"{resolved_base_url}/api/chat"
     try:
-        response = requests.post(url, json=payload, timeout=resolved_timeout)
+        # Shared keep-alive session: the orchestrator's later spec request to
+        # the same Ollama server reuses this connection.
+        response = get_session().post(url, json=payload, timeout=resolved_timeout)
         response.raise_for_status()
     except requests.exceptions.ConnectionError as exc:
         raise RuntimeError(
@@ -178,8 +196,11 @@ def generate_idle_rpg_design(
 def _strip_code_fences(text: str) -> str:
     """Remove leading/trailing markdown code fences if present."""
     text = text.strip()
-    text = re.sub(r"^```[^\n]*\n?", "", text)
-    text = re.sub(r"\n?```\s*$", "", text)
+    if text.startswith("```"):
+        # Drop the whole opening fence line, including any language tag.
+        text = text.partition("\n")[2]
+    if text.endswith("```"):
+        text = text[:-3]
     return text.strip()
 
 
@@ -193,15 +214,16 @@ def _parse_and_validate(raw: str) -> Dict[str, Any]:
     cleaned = _strip_code_fences(raw)
 
     # If the model wrapped the JSON in extra text, try to extract just the
-    # outermost JSON object.
-    if not cleaned.startswith("{"):
-        match = re.search(r"\{", cleaned)
-        if match:
-            cleaned = cleaned[match.start():]
+    # outermost JSON object (first "{" through last "}").
+    if not (cleaned.startswith("{") and cleaned.endswith("}")):
+        start = cleaned.find("{")
+        end = cleaned.rfind("}")
+        if start != -1 and end > start:
+            cleaned = cleaned[start:end + 1]
 
     try:
-        data = json.loads(cleaned)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(cleaned) if orjson is not None else json.loads(cleaned)
+    except json.JSONDecodeError as exc:  # orjson's error subclasses this one
         raise ValueError(
             f"Ollama response is not valid JSON: {exc}\n"
             f"Raw response (first 500 chars): {raw[:500]}"
@@ -220,25 +242,17 @@ def _parse_and_validate(raw: str) -> Dict[str, Any]:
             f"Keys present: {list(data.keys())}"
         )
 
-    # Check list keys are actually lists
-    wrong_type_errors = []
-    for key in _LIST_KEYS:
-        if not isinstance(data[key], list):
-            wrong_type_errors.append(
-                f"'{key}' must be a list, got {type(data[key]).__name__}"
-            )
+    # Check every required key has the expected type, in one pass
+    wrong_type_errors = [
+        f"'{key}' must be a {type_name}, got {type(data[key]).__name__}"
+        for key, expected, type_name in _KEY_TYPES
+        if not isinstance(data[key], expected)
+    ]
     if wrong_type_errors:
         raise ValueError(
             "Design document has incorrect types:\n" + "\n".join(wrong_type_errors)
         )
 
-    # Check string keys
-    for key in ("world", "premise"):
-        if not isinstance(data[key], str):
-            raise ValueError(
-                f"'{key}' must be a string, got {type(data[key]).__name__}"
-            )
-
     # Deep-validate against the Pydantic schema model
     try:
         from schemas.idle_rpg_design_doc import validate_idle_rpg_design_doc
@@ -0,0 +1,29 @@
+"""
+game_generator/ai/http_session.py – Keep-alive HTTP sessions for Ollama calls.
+
+``requests.Session`` is not documented as thread-safe, so rather than one
+process-wide session each thread gets its own, created on first use and
+reused for every later call from that thread.  The Ollama translator and the
+design assistant both go through :func:`get_session`.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+_local = threading.local()
+
+
+def get_session() -> Any:
+    """Return the calling thread's ``requests.Session`` for Ollama calls.
+
+    Reusing a session keeps the connection to the Ollama server alive
+    across requests instead of opening a new TCP connection for each one.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+
+        session = _local.session = requests.Session()
+    return session
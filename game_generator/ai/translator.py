@@ -3,13 +3,26 @@ game_generator/ai/translator.py – Lightweight Ollama translator for spec gener
 
 Provides OllamaTranslator, a minimal Ollama HTTP client used by the game
 generator pipeline.  This removes the dependency on aibase.py from gamegen.py.
+
+Single calls go through :meth:`OllamaTranslator._generate_ollama` (``requests``);
+batches of independent prompts can be sent concurrently with
+:meth:`OllamaTranslator.generate_many` (``httpx``), so their latencies overlap
+instead of adding up.  :meth:`OllamaTranslator.generate_stream` yields text
+as Ollama produces it, for callers that show output progressively.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .http_session import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +31,60 @@ DEFAULT_BASE_URL = "http://localhost:11434"
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_MAX_TOKENS = 2000
 
+# Requests generate_many() keeps in flight at once.  Ollama queues requests
+# beyond its own OLLAMA_NUM_PARALLEL slots, so keep this at or below that.
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Deterministic (temperature 0) responses kept per translator, LRU-evicted.
+RESPONSE_CACHE_SIZE = 256
+
+# Connection pool limits for the async client used by generate_many().
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+
+
+def _max_concurrency_from_env() -> int:
+    """Read ``OLLAMA_MAX_CONCURRENCY``, falling back to the default on a bad value."""
+    raw = os.getenv("OLLAMA_MAX_CONCURRENCY")
+    if raw is None:
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid OLLAMA_MAX_CONCURRENCY=%r; using %d.",
+            raw,
+            DEFAULT_MAX_CONCURRENCY,
+        )
+        return DEFAULT_MAX_CONCURRENCY
+
+
+def _import_httpx() -> Any:
+    try:
+        import httpx
+    except ImportError as exc:
+        raise ImportError(
+            "The 'httpx' package is required for concurrent Ollama calls. "
+            "Install it with: pip install httpx"
+        ) from exc
+    return httpx
+
+
+def _new_async_client(timeout: Optional[int]) -> Any:
+    """Create the pooled ``httpx.AsyncClient`` for one :meth:`generate_many` batch.
+
+    A new client is created per batch because an ``AsyncClient`` is bound
+    to the event loop it was first used on.
+    """
+    httpx = _import_httpx()
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
 
 class OllamaTranslator:
     """Minimal Ollama HTTP client compatible with the spec.generate_spec() interface."""
@@ -28,12 +95,23 @@ class OllamaTranslator:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         timeout: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        base_url: Optional[str] = None,
     ) -> None:
         self.model = model or os.getenv("OLLAMA_MODEL", DEFAULT_MODEL)
         self.temperature = temperature if temperature is not None else DEFAULT_TEMPERATURE
         self.max_tokens = max_tokens or DEFAULT_MAX_TOKENS
-        self.ollama_base_url = os.getenv("OLLAMA_BASE_URL", DEFAULT_BASE_URL)
+        self.ollama_base_url = (
+            base_url or os.getenv("OLLAMA_BASE_URL", DEFAULT_BASE_URL)
+        ).rstrip("/")
         self.timeout = timeout
+        self.max_concurrency = max(
+            1,
+            max_concurrency or _max_concurrency_from_env(),
+        )
+        # Only used when temperature == 0, where the output is deterministic.
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _generate_ollama(self, system_prompt: str, user_prompt: str) -> str:
         """Generate text via the Ollama /api/generate endpoint."""
@@ -45,7 +123,117 @@ class OllamaTranslator:
             ) from exc
 
         url = f"{self.ollama_base_url}/api/generate"
-        payload = {
+        payload = self._payload(system_prompt, user_prompt)
+        key = self._cache_key(payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        try:
+            resp = get_session().post(url, json=payload, timeout=self.timeout)
+            return self._cache_put(key, self._read_response(resp, url))
+        except RuntimeError:
+            raise
+        except requests.exceptions.ConnectionError:
+            raise RuntimeError(self._connect_error())
+        except Exception as exc:
+            raise RuntimeError(f"Error during Ollama generation: {exc}") from exc
+
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """Yield the response text chunk by chunk as Ollama generates it.
+
+        Uses Ollama's streaming mode, so the first chunk arrives without
+        waiting for the whole generation.  ``"".join(...)`` of the chunks is
+        the unstripped equivalent of :meth:`_generate_ollama`.  Streamed
+        responses are not cached.
+        """
+        try:
+            import requests
+        except ImportError as exc:
+            raise ImportError(
+                "The 'requests' package is required. Install it with: pip install requests"
+            ) from exc
+
+        url = f"{self.ollama_base_url}/api/generate"
+        payload = {**self._payload(system_prompt, user_prompt), "stream": True}
+        try:
+            with get_session().post(
+                url, json=payload, timeout=self.timeout, stream=True
+            ) as resp:
+                self._check_status(resp, url)
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise RuntimeError(f"Ollama error: {chunk['error']}")
+                    text = chunk.get("response", "")
+                    if text:
+                        yield text
+                    if chunk.get("done"):
+                        return
+        except RuntimeError:
+            raise
+        except requests.exceptions.ConnectionError:
+            raise RuntimeError(self._connect_error())
+        except Exception as exc:
+            raise RuntimeError(f"Error during Ollama generation: {exc}") from exc
+
+    async def _agenerate_ollama(
+        self,
+        client: Any,
+        sem: asyncio.Semaphore,
+        system_prompt: str,
+        user_prompt: str,
+    ) -> str:
+        """Async :meth:`_generate_ollama` over an ``httpx.AsyncClient``, gated by *sem*."""
+        httpx = _import_httpx()
+        url = f"{self.ollama_base_url}/api/generate"
+        payload = self._payload(system_prompt, user_prompt)
+        key = self._cache_key(payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        try:
+            async with sem:
+                resp = await client.post(url, json=payload)
+            return self._cache_put(key, self._read_response(resp, url))
+        except RuntimeError:
+            raise
+        except httpx.ConnectError:
+            raise RuntimeError(self._connect_error())
+        except Exception as exc:
+            raise RuntimeError(f"Error during Ollama generation: {exc}") from exc
+
+    async def agenerate_many(
+        self, prompts: Sequence[Tuple[str, str]]
+    ) -> List[str]:
+        """Generate a response for each ``(system_prompt, user_prompt)`` pair concurrently.
+
+        At most :attr:`max_concurrency` requests are in flight at once.
+        Results are returned in the order of *prompts*.  The first failure
+        raises :exc:`RuntimeError`, as :meth:`_generate_ollama` does.
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+        async with _new_async_client(self.timeout) as client:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._agenerate_ollama(client, sem, system_prompt, user_prompt)
+                        for system_prompt, user_prompt in prompts
+                    )
+                )
+            )
+
+    def generate_many(self, prompts: Sequence[Tuple[str, str]]) -> List[str]:
+        """Blocking wrapper around :meth:`agenerate_many`.
+
+        Must not be called from a running event loop; ``await``
+        :meth:`agenerate_many` there instead.
+        """
+        return asyncio.run(self.agenerate_many(prompts))
+
+    def _payload(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        return {
             "model": self.model,
             "prompt": f"{system_prompt}\n\n{user_prompt}",
             "stream": False,
@@ -54,23 +242,53 @@ class OllamaTranslator:
                 "num_predict": self.max_tokens,
             },
         }
-        try:
-            resp = requests.post(url, json=payload, timeout=self.timeout)
-            if not resp.ok:
-                if resp.status_code == 404:
-                    raise RuntimeError(
-                        f"Ollama returned 404 for POST {url}. "
-                        f"The model '{self.model}' may not be pulled. "
-                        f"Run: ollama pull {self.model}"
-                    )
-                resp.raise_for_status()
-            return resp.json()["response"].strip()
-        except RuntimeError:
-            raise
-        except requests.exceptions.ConnectionError:
+
+    def _cache_key(self, payload: Dict[str, Any]) -> Optional[str]:
+        """Return the response-cache key for *payload*, or *None* if uncacheable.
+
+        Only temperature-0 requests are cached; the key covers the model,
+        prompt and every generation option.
+        """
+        if self.temperature != 0:
+            return None
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _cache_get(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        with self._cache_lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: Optional[str], value: str) -> str:
+        if key is not None:
+            with self._cache_lock:
+                self._cache[key] = value
+                self._cache.move_to_end(key)
+                while len(self._cache) > RESPONSE_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return value
+
+    def _read_response(self, resp: Any, url: str) -> str:
+        """Return the generated text from a ``requests`` or ``httpx`` response."""
+        self._check_status(resp, url)
+        return resp.json()["response"].strip()
+
+    def _check_status(self, resp: Any, url: str) -> None:
+        if resp.status_code == 404:
             raise RuntimeError(
-                f"Cannot connect to Ollama at {self.ollama_base_url}. "
-                "Make sure Ollama is running (https://ollama.com) and the model is pulled."
+                f"Ollama returned 404 for POST {url}. "
+                f"The model '{self.model}' may not be pulled. "
+                f"Run: ollama pull {self.model}"
             )
-        except Exception as exc:
-            raise RuntimeError(f"Error during Ollama generation: {exc}") from exc
+        resp.raise_for_status()
+
+    def _connect_error(self) -> str:
+        return (
+            f"Cannot connect to Ollama at {self.ollama_base_url}. "
+            "Make sure Ollama is running (https://ollama.com) and the model is pulled."
+        )
@@ -11,8 +11,9 @@ from __future__ import annotations
 import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from .spec import GameSpec
 
@@ -23,6 +24,9 @@ IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
 AUDIO_EXTENSIONS = {".wav", ".mp3", ".ogg"}
 ASSET_EXTENSIONS = IMAGE_EXTENSIONS | AUDIO_EXTENSIONS
 
+# Upper bound on concurrent copies in import_assets (copying is I/O-bound).
+MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
 # Heuristic tag weights: maps a "role" keyword to candidate filename fragments
 # (longest match wins; case-insensitive)
 _ROLE_TAGS: Dict[str, List[str]] = {
@@ -55,11 +59,9 @@ class AssetIndexer:
             return []
 
         found: List[Path] = []
-        for root, _dirs, files in os.walk(self.assets_dir):
-            for fname in files:
-                p = Path(root) / fname
-                if p.suffix.lower() in ASSET_EXTENSIONS:
-                    found.append(p)
+        for entry in _iter_files(str(self.assets_dir)):
+            if os.path.splitext(entry.name)[1].lower() in ASSET_EXTENSIONS:
+                found.append(Path(entry.path))
 
         logger.info("AssetIndexer: found %d asset files in '%s'.", len(found), self.assets_dir)
         return found
@@ -124,15 +126,20 @@ def import_assets(
     out_dir.mkdir(parents=True, exist_ok=True)
 
     copied: List[str] = []
-    for role, src_path in matches.items():
-        dest_name = f"{role}{src_path.suffix.lower()}"
-        dest_path = out_dir / dest_name
-        shutil.copy2(src_path, dest_path)
-        rel = str(dest_path.relative_to(dest_dir)).replace(os.sep, "/")
-        copied.append(rel)
-        logger.info("Copied asset '%s' -> '%s'.", src_path.name, rel)
-
-    if not matches:
+    if matches:
+        dest_root = Path(dest_dir)
+        jobs = [
+            (src_path, out_dir / f"{role}{src_path.suffix.lower()}")
+            for role, src_path in matches.items()
+        ]
+        workers = min(MAX_COPY_WORKERS, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() preserves input order, so the result follows spec order.
+            for dest_path in pool.map(_copy_one, jobs):
+                copied.append(
+                    str(dest_path.relative_to(dest_root)).replace(os.sep, "/")
+                )
+    else:
         logger.warning(
             "No assets were matched from '%s'. "
             "The project will use placeholder colours in code.",
@@ -146,6 +153,51 @@ def import_assets(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _iter_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Yield a ``DirEntry`` for every non-directory under *root*.
+
+    Same traversal order as ``os.walk`` (a directory's files before its
+    subdirectories, symlinked directories not followed, unreadable
+    directories skipped) but reuses the ``DirEntry`` type information
+    instead of building ``Path`` objects for every name.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs: List[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield entry
+        elif not entry.is_symlink():
+            subdirs.append(entry.path)
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
+
+def _copy_one(job: Tuple[Path, Path]) -> Path:
+    """
+    Place a single ``(src, dest)`` asset pair and return *dest*.
+
+    Hard-links when source and destination share a filesystem; falls back
+    to a real copy on any ``OSError`` (cross-device, unsupported, ...).
+    """
+    src_path, dest_path = job
+    dest_path.unlink(missing_ok=True)
+    try:
+        os.link(src_path, dest_path)
+    except OSError:
+        shutil.copy2(src_path, dest_path)
+    logger.info("Copied asset '%s' -> '%s'.", src_path.name, dest_path.name)
+    return dest_path
+
+
 def _best_match(role: str, candidates: List[Path]) -> Optional[Path]:
     """
     Return the candidate Path whose filename best matches *role*.
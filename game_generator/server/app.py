@@ -7,7 +7,7 @@ Endpoints
     POST /spec                        – Generate a GameSpec (heuristic or AI)
     POST /design-doc                  – Generate an Idle RPG design document
     POST /generate                    – Start a background generation job
-    GET  /status/{run_id}             – Poll run status + ALL progress events
+    GET  /status/{run_id}             – Poll run status + recent progress events
     GET  /download/{run_id}           – Download the completed output ZIP
 
 Run locally
@@ -206,8 +206,9 @@ def get_status(run_id: str) -> Dict[str, Any]:
     """
     Return the current status of a generation run.
 
-    Returns **all** progress events so the client can accumulate them without
-    any message being silently dropped or replaced.
+    Returns every progress event the tracker still holds (the most recent
+    ``MAX_STATUS_EVENTS``) plus ``events_total`` so the client can accumulate
+    them without any message being rendered twice.
     """
     status = job_manager.get_status(run_id, DEFAULT_RUNS_DIR)
     if status is None:
@@ -432,8 +433,11 @@ async function pollStatus() {
     if (!res.ok) { appendLog('✗ ' + (data.detail || 'Poll error'), 'log-error'); stopPolling(); return; }
 
     const events = data.events || [];
+    // events holds the most recent entries; events_total counts all of them
+    const total = data.events_total !== undefined ? data.events_total : events.length;
+    const first = total - events.length;
     // Only render events we haven't shown yet — messages NEVER disappear
-    for (let i = _seenCount; i < events.length; i++) {
+    for (let i = Math.max(_seenCount - first, 0); i < events.length; i++) {
       const ev = events[i];
       const pct = ev.percent !== undefined ? ' (' + ev.percent + '%)' : '';
       appendLog('[' + ev.stage + ']' + pct + ' ' + ev.message, 'log-stage');
@@ -441,7 +445,7 @@ async function pollStatus() {
         document.getElementById('pbar').style.width = ev.percent + '%';
       }
     }
-    _seenCount = events.length;
+    _seenCount = total;
 
     if (data.status === 'completed') {
       appendLog('✓ Generation complete!', 'log-success');
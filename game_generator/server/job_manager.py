@@ -73,7 +73,7 @@ def get_status(run_id: str, runs_dir: str) -> Optional[Dict[str, Any]]:
     with _LOCK:
         tracker = _JOBS.get(run_id)
     if tracker is not None:
-        # Return ALL events (no trim) so the UI can accumulate them.
+        # Return every event still held in memory so the UI can accumulate them.
         status = tracker.get_status(last_n_events=10_000)
         return status
     return load_status(run_id, runs_dir=runs_dir)
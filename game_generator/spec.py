@@ -41,6 +41,10 @@ _GENRE_KEYWORDS: Dict[str, List[str]] = {
 
 _DEFAULT_GENRE = "top_down_shooter"
 
+# Markdown code fences Ollama sometimes wraps its JSON in (compiled once).
+_LEADING_FENCE_RE = re.compile(r"^```[^\n]*\n?")
+_TRAILING_FENCE_RE = re.compile(r"\n?```$")
+
 
 def _classify_genre(prompt: str) -> str:
     """Return the best-matching genre name based on keyword scoring."""
@@ -181,25 +185,36 @@ def _default_orientation(genre: str) -> str:
     }.get(genre, "portrait")
 
 
+# Fixed system prompt for Ollama spec generation.  Kept byte-identical and
+# ahead of the per-request text so Ollama can reuse the cached prefix
+# across consecutive requests to the same model.
+_SPEC_SYSTEM_PROMPT = (
+    "You are a game design assistant. Given a game description, produce a JSON object "
+    "with EXACTLY these keys: title, genre, mechanics (list), required_assets (list), "
+    "screens (list), controls (object), progression (object). "
+    "genre must be one of: top_down_shooter, idle_rpg. "
+    "Output only valid JSON, no extra text."
+)
+
+
+def _strip_code_fences(raw: str) -> str:
+    """Remove a leading ```lang line and a trailing ``` fence, if present."""
+    raw = raw.strip()
+    if "```" not in raw:
+        return raw
+    raw = _LEADING_FENCE_RE.sub("", raw, count=1)
+    return _TRAILING_FENCE_RE.sub("", raw.strip(), count=1)
+
+
 def _ollama_spec(prompt: str, translator: Any) -> Optional[GameSpec]:
     """
     Try to build a GameSpec via Ollama JSON generation.
     Returns None if Ollama is unavailable or produces invalid JSON.
     """
-    system_prompt = (
-        "You are a game design assistant. Given a game description, produce a JSON object "
-        "with EXACTLY these keys: title, genre, mechanics (list), required_assets (list), "
-        "screens (list), controls (object), progression (object). "
-        "genre must be one of: top_down_shooter, idle_rpg. "
-        "Output only valid JSON, no extra text."
-    )
     user_prompt = f"Game description: {prompt}\n\nJSON:"
     try:
-        raw = translator._generate_ollama(system_prompt, user_prompt)
-        # strip potential code fences
-        raw = re.sub(r"^```[^\n]*\n?", "", raw.strip())
-        raw = re.sub(r"\n?```$", "", raw.strip())
-        data = json.loads(raw)
+        raw = translator._generate_ollama(_SPEC_SYSTEM_PROMPT, user_prompt)
+        data = json.loads(_strip_code_fences(raw))
         if not isinstance(data, dict) or "genre" not in data:
             return None
         if data.get("genre") not in _GENRE_KEYWORDS:
@@ -8,15 +8,32 @@ import logging
 import os
 import zipfile
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Above this many uncompressed bytes of generated text, favour deflate speed
+# over ratio.  Smaller projects (every built-in genre) use the zlib default.
+LARGE_PROJECT_BYTES = 10_000_000
+
+
+def compresslevel_for_size(total_bytes: int) -> Optional[int]:
+    """
+    Return the deflate level to use for a project of *total_bytes*.
+
+    ``1`` (fastest) above ``LARGE_PROJECT_BYTES``, otherwise ``None``
+    (zlib default).
+    """
+    if total_bytes > LARGE_PROJECT_BYTES:
+        return 1
+    return None
+
 
 def export_to_zip(
     project_files: Dict[str, str],
     project_dir: str,
     output_zip: str,
+    compresslevel: Optional[int] = None,
 ) -> None:
     """
     Write a ZIP archive containing:
@@ -31,11 +48,25 @@ def export_to_zip(
                        there.  Pass an empty string to skip.
         output_zip:    Destination ``.zip`` file path (will be created /
                        overwritten).
+        compresslevel: Deflate level (0–9) passed to :class:`zipfile.ZipFile`;
+                       ``None`` uses the zlib default and ``0`` stores the
+                       files uncompressed.  See :func:`compresslevel_for_size`.
     """
     output_path = Path(output_zip)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+    if compresslevel == 0:
+        # Plain STORED entries rather than deflate streams at level 0.
+        compression, compresslevel = zipfile.ZIP_STORED, None
+    else:
+        compression = zipfile.ZIP_DEFLATED
+
+    with zipfile.ZipFile(
+        output_path,
+        "w",
+        compression=compression,
+        compresslevel=compresslevel,
+    ) as zf:
         # Write text source files
         for rel_path, content in sorted(project_files.items()):
             logger.debug("ZIP: adding text file '%s'.", rel_path)
@@ -6,8 +6,9 @@ Public API:
     Orchestrator        – run the complete end-to-end pipeline
     RunTracker          – structured logging and progress-event tracking
     load_status         – load status.json for a run
+    iter_events         – stream the progress events recorded for a run
 """
 
 from .constraint_resolver import ConstraintResolver  # noqa: F401
 from .orchestrator import Orchestrator               # noqa: F401
-from .run_tracker import RunTracker, load_status     # noqa: F401
+from .run_tracker import RunTracker, iter_events, load_status  # noqa: F401
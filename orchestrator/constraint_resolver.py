@@ -19,6 +19,9 @@ DEFAULTS: Dict[str, Any] = {
     "scope": "prototype",
 }
 
+# Constraint keys copied onto the GameSpec once resolution is complete.
+SPEC_CONSTRAINT_KEYS = ("art_style", "platform", "scope", "dimension", "online")
+
 
 class ConstraintResolver:
     """Resolve game constraints, enforcing Flame engine limits."""
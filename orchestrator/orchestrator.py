@@ -12,11 +12,14 @@ Coordinates the full pipeline:
 
 from __future__ import annotations
 
+import copy
+import functools
+import json
 import logging
 import tempfile
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from .constraint_resolver import ConstraintResolver
+from .constraint_resolver import SPEC_CONSTRAINT_KEYS, ConstraintResolver
 from .run_tracker import RunTracker
 
 logger = logging.getLogger(__name__)
@@ -57,6 +60,25 @@ def _enrich_spec_with_dialogue(
         logger.debug("GameDesignAgent dialogue enrichment skipped: %s", exc)
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_design_template(
+    prompt: str, seed: Optional[int]
+) -> Tuple[Dict[str, Any], str, str]:
+    """
+    Return ``(doc, json_text, markdown_text)`` for the template design doc.
+
+    The template generator is deterministic for a given ``(prompt, seed)``
+    within a process, so repeated offline runs reuse the rendered output.
+    Callers must copy *doc* before handing it to code that may mutate it.
+    """
+    from game_generator.ai.design_assistant import (
+        design_doc_to_markdown,
+        generate_idle_rpg_design_template,
+    )
+    doc = generate_idle_rpg_design_template(prompt, seed=seed)
+    return doc, json.dumps(doc, indent=2), design_doc_to_markdown(doc)
+
+
 class Orchestrator:
     """End-to-end game generation coordinator."""
 
@@ -129,7 +151,7 @@ class Orchestrator:
         from game_generator.spec import generate_spec
         from game_generator.scaffolder import scaffold_project
         from game_generator.asset_importer import import_assets
-        from game_generator.zip_exporter import export_to_zip
+        from game_generator.zip_exporter import compresslevel_for_size, export_to_zip
         from workers.validator import ValidatorWorker
 
         # --idle-rpg implies design_doc and forces idle_rpg genre
@@ -144,40 +166,43 @@ class Orchestrator:
             if run_tracker is not None:
                 run_tracker.emit(stage, message, percent=percent)
 
+        # Single progress sink: always logged; echoed to stdout only when no
+        # tracker is attached (the tracker already records every stage).
+        def _log(message: str, level: int = logging.INFO) -> None:
+            logger.log(level, message.strip())
+            if run_tracker is None:
+                print(message)
+
         # ── 1. Resolve constraints ──────────────────────────────────────
         _emit("constraints", "Resolving constraints …", percent=0)
-        resolver = ConstraintResolver(interactive=self.interactive)
-        constraints = resolver.resolve(
-            {
-                "platform": platform,
-                "scope": scope,
-                **(constraint_overrides or {}),
-            }
+        # Pull the genre override out before the spread so it never reaches
+        # the resolver and is only looked up once.
+        genre_override = (
+            constraint_overrides.pop("genre_override", None)
+            if constraint_overrides
+            else None
         )
+        resolver = ConstraintResolver(interactive=self.interactive)
+        resolver_input: Dict[str, Any] = {"platform": platform, "scope": scope}
+        if constraint_overrides:
+            resolver_input.update(constraint_overrides)
+        constraints = resolver.resolve(resolver_input)
         logger.info("Constraints resolved: %s", constraints)
 
         # ── 2. Generate GameSpec ────────────────────────────────────────
-        print("[1/4] Generating game spec …")
+        _log("[1/4] Generating game spec …")
         _emit("spec", "Generating game spec …", percent=10)
         spec = generate_spec(prompt, translator=translator)
         # Apply genre override from --idle-rpg
-        genre_override = (constraint_overrides or {}).pop("genre_override", None)
         if genre_override:
             spec["genre"] = genre_override
         # Merge constraints into spec so downstream workers can read them.
-        spec.update(
-            {
-                "art_style": constraints["art_style"],
-                "platform": constraints["platform"],
-                "scope": constraints["scope"],
-                "dimension": constraints["dimension"],
-                "online": constraints["online"],
-            }
-        )
+        for key in SPEC_CONSTRAINT_KEYS:
+            spec[key] = constraints[key]
         if assets_dir:
             spec["assets_dir"] = assets_dir
-        print(f"      Title : {spec['title']}")
-        print(f"      Genre : {spec['genre']}")
+        _log(f"      Title : {spec['title']}")
+        _log(f"      Genre : {spec['genre']}")
         _emit("spec", f"Spec ready – title={spec['title']} genre={spec['genre']}", percent=20)
 
         # ── 2b. Optional design document generation ─────────────────────
@@ -186,12 +211,13 @@ class Orchestrator:
         if design_doc:
             from game_generator.ai.design_assistant import (
                 generate_idle_rpg_design,
-                generate_idle_rpg_design_template,
                 design_doc_to_markdown,
             )
-            print("[1b]  Generating Idle RPG design document …")
+            _log("[1b]  Generating Idle RPG design document …")
             _emit("design_doc", "Generating Idle RPG design document …", percent=25)
             doc = None
+            # (json_text, markdown_text) when the cached template was used
+            rendered: Optional[Tuple[str, str]] = None
             try:
                 doc = generate_idle_rpg_design(
                     prompt,
@@ -202,40 +228,54 @@ class Orchestrator:
                     timeout=ollama_timeout,
                     seed=ollama_seed,
                 )
-                print("      Design document generated via Ollama.")
+                _log("      Design document generated via Ollama.")
             except (RuntimeError, ImportError) as exc:
                 if idle_rpg:
                     # Ollama unavailable – fall back to template
-                    print(
+                    _log(
                         f"      [WARNING] Ollama unavailable ({exc}); "
-                        "using template-based design doc."
+                        "using template-based design doc.",
+                        logging.WARNING,
                     )
                     _emit("design_doc", "Ollama unavailable; using template fallback.", percent=28)
                     fallback_seed = seed if seed is not None else (ollama_seed if ollama_seed is not None else None)
-                    doc = generate_idle_rpg_design_template(prompt, seed=fallback_seed)
+                    cached_doc, json_text, md_text = _cached_design_template(
+                        prompt, fallback_seed
+                    )
+                    doc = copy.deepcopy(cached_doc)
+                    rendered = (json_text, md_text)
                 else:
                     import sys
-                    print(f"[ERROR] Design document generation failed: {exc}")
+                    _log(
+                        f"[ERROR] Design document generation failed: {exc}",
+                        logging.ERROR,
+                    )
                     if run_tracker is not None:
                         run_tracker.error(f"Design document generation failed: {exc}")
                     sys.exit(1)
             except ValueError as exc:
                 import sys
-                print(f"[ERROR] Design document generation failed: {exc}")
+                _log(
+                    f"[ERROR] Design document generation failed: {exc}",
+                    logging.ERROR,
+                )
                 if run_tracker is not None:
                     run_tracker.error(f"Design document generation failed: {exc}")
                 sys.exit(1)
 
             if design_doc_format == "md":
-                design_doc_content = design_doc_to_markdown(doc)
+                design_doc_content = (
+                    rendered[1] if rendered is not None else design_doc_to_markdown(doc)
+                )
                 resolved_design_doc_path = design_doc_path or "DESIGN.md"
             else:
-                import json as _json
-                design_doc_content = _json.dumps(doc, indent=2)
+                design_doc_content = (
+                    rendered[0] if rendered is not None else json.dumps(doc, indent=2)
+                )
                 resolved_design_doc_path = design_doc_path or "assets/design/design.json"
             # Make design doc data available to the genre generator (e.g. idle_rpg)
             spec["design_doc_data"] = doc
-            print(f"      Design doc will be written to: {resolved_design_doc_path}")
+            _log(f"      Design doc will be written to: {resolved_design_doc_path}")
             _emit("design_doc", f"Design doc ready → {resolved_design_doc_path}", percent=35)
 
             # ── 2c. Enrich spec with AI-generated NPC dialogue ───────────
@@ -247,25 +287,25 @@ class Orchestrator:
             # 3. Import assets
             imported_paths: list = []
             if assets_dir:
-                print("[2/4] Importing assets …")
+                _log("[2/4] Importing assets …")
                 _emit("assets", "Importing assets …", percent=40)
                 imported_paths = import_assets(spec, assets_dir, tmp_dir)
-                print(f"      Imported {len(imported_paths)} asset(s).")
+                _log(f"      Imported {len(imported_paths)} asset(s).")
                 _emit("assets", f"Imported {len(imported_paths)} asset(s).", percent=50)
             else:
-                print(
+                _log(
                     "[2/4] No --assets-dir supplied; "
                     "project will reference assets/imported/ (populate manually)."
                 )
                 _emit("assets", "No assets dir supplied; skipping import.", percent=50)
 
             # 4. Scaffold
-            print("[3/4] Scaffolding Flutter/Flame project …")
+            _log("[3/4] Scaffolding Flutter/Flame project …")
             _emit("scaffold", "Scaffolding Flutter/Flame project …", percent=60)
             project_files = scaffold_project(
                 spec, imported_asset_paths=imported_paths
             )
-            print(f"      Generated {len(project_files)} file(s).")
+            _log(f"      Generated {len(project_files)} file(s).")
             _emit("scaffold", f"Generated {len(project_files)} file(s).", percent=75)
 
             # 4b. Inject design document into project files
@@ -274,7 +314,7 @@ class Orchestrator:
 
             # 4c. Optional validation + auto-fix
             if auto_fix or run_validation:
-                print("[3b]  Running Flutter validation …")
+                _log("[3b]  Running Flutter validation …")
                 _emit("validation", "Running Flutter validation …", percent=80)
                 worker = ValidatorWorker(
                     project_dir=tmp_dir, project_files=project_files
@@ -282,7 +322,7 @@ class Orchestrator:
                 worker.write_files()
                 success, logs = worker.validate(run_smoke_test=smoke_test, smoke_test_mode=smoke_test_mode)
                 if not success and auto_fix:
-                    print("      Validation failed; attempting auto-fix …")
+                    _log("      Validation failed; attempting auto-fix …")
                     _emit("validation", "Validation failed; attempting auto-fix …", percent=85)
                     project_files = worker.auto_fix(spec, logs, project_files)
                     worker.project_files = project_files
@@ -290,10 +330,19 @@ class Orchestrator:
                 _emit("validation", "Validation complete.", percent=90)
 
             # 5. ZIP
-            print("[4/4] Creating ZIP …")
+            _log("[4/4] Creating ZIP …")
             _emit("zip", "Creating ZIP archive …", percent=95)
-            export_to_zip(project_files, tmp_dir, output_zip)
+            total_bytes = sum(
+                len(content) for content in project_files.values()
+                if isinstance(content, (str, bytes))
+            )
+            export_to_zip(
+                project_files,
+                tmp_dir,
+                output_zip,
+                compresslevel=compresslevel_for_size(total_bytes),
+            )
             _emit("zip", f"ZIP created → {output_zip}", percent=100)
 
-        print(f"\nDone!  ZIP: {output_zip}")
-        print("  cd <unzipped-folder> && flutter pub get && flutter run\n")
+        _log(f"\nDone!  ZIP: {output_zip}")
+        _log("  cd <unzipped-folder> && flutter pub get && flutter run\n")
@@ -6,17 +6,78 @@ Each generation run gets a ``runs/{run_id}/`` directory containing:
 * ``logs.txt``     – human-readable timestamped log lines
 * ``logs.jsonl``   – optional structured JSON-Lines log (one object per line)
 * ``events.jsonl`` – append-only progress events (stage / percent / message / timestamp)
-* ``status.json``  – current pipeline status (updated on every event)
+* ``events.bin``   – length-prefixed binary alternative to ``events.jsonl``
+  (``binary_events=True``); read it back with :func:`iter_events`
+* ``status.json``  – current pipeline status with the most recent events
 """
 
 from __future__ import annotations
 
 import json
 import os
+import queue
+import struct
 import threading
+import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder – fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # optional binary event codec – fall back to compact JSON
+    msgpack = None  # type: ignore[assignment]
+
+# Buffered log lines are written out once any of these limits is reached,
+# and at least every ``LOG_FLUSH_INTERVAL`` seconds by the flusher thread.
+LOG_FLUSH_LINES = 100
+LOG_FLUSH_BYTES = 8192
+LOG_FLUSH_INTERVAL = 1.0
+
+# While events are arriving, status.json is rewritten by the writer thread
+# once this many seconds have passed since the last write or after
+# ``STATUS_FLUSH_EVERY`` new events, whichever comes first.
+STATUS_FLUSH_INTERVAL = 0.5
+STATUS_FLUSH_EVERY = 25
+
+# Number of most-recent events kept in memory and in status.json; the full
+# history is always in events.jsonl.
+MAX_STATUS_EVENTS = 200
+
+# Write buffer for the persistent ``events.jsonl`` append handle.
+EVENTS_BUFFER_SIZE = 64 * 1024
+
+# Levels that bypass buffering and hit the disk immediately.
+_URGENT_LEVELS = frozenset({"ERROR", "CRITICAL"})
+
+# Queue sentinel telling the writer thread to drain and exit.
+_STOP = object()
+
+# load_status() retries a status.json caught mid-rewrite this many times.
+_STATUS_READ_ATTEMPTS = 3
+_STATUS_READ_RETRY_DELAY = 0.01
+
+# load_status() cache: path -> ((st_mtime_ns, st_size), parsed status),
+# oldest entries evicted first beyond _STATUS_CACHE_SIZE runs.
+_STATUS_CACHE: Dict[Path, Any] = {}
+_STATUS_CACHE_LOCK = threading.Lock()
+_STATUS_CACHE_SIZE = 256
+
+# events.bin layout: magic + one codec byte, then records framed as a
+# little-endian uint32 payload length followed by the encoded event.
+EVENTS_BIN_MAGIC = b"GGEV"
+_CODEC_MSGPACK = b"M"
+_CODEC_JSON = b"J"
+_LEN_PREFIX = struct.Struct("<I")
+
+# Largest batch handed to a single ``os.writev`` call (POSIX IOV_MAX floor).
+_IOV_MAX = 1024
 
 
 class RunTracker:
@@ -30,6 +91,23 @@ class RunTracker:
         Base directory under which ``runs/{run_id}/`` is created.
     json_logs:
         When *True*, also write structured JSON-Lines to ``logs.jsonl``.
+    buffered:
+        When *True* (default), log lines are buffered in memory and written
+        in batches (see ``LOG_FLUSH_*``); ``ERROR``/``CRITICAL`` lines and
+        lifecycle transitions always flush.  Progress events are queued and
+        appended to ``events.jsonl`` in batches by a background writer
+        thread, so :meth:`emit` never waits on disk I/O.  Pass *False* to
+        write every line and event through immediately.
+    binary_events:
+        When *True*, progress events are written to ``events.bin`` as
+        length-prefixed msgpack records (compact JSON when ``msgpack`` is
+        not installed) instead of ``events.jsonl``.  Intended for runs that
+        emit thousands of sub-progress events; use :func:`iter_events` to
+        read them back.
+
+    Nothing touches the disk until the first log line, event or lifecycle
+    call; call :meth:`start` (or enter the tracker as a context manager) to
+    create the run directory and write the initial ``status.json`` up front.
     """
 
     def __init__(
@@ -37,45 +115,125 @@ class RunTracker:
         run_id: str,
         runs_dir: str = "runs",
         json_logs: bool = False,
+        buffered: bool = True,
+        binary_events: bool = False,
     ) -> None:
         self.run_id = run_id
         self.run_dir = Path(runs_dir) / run_id
-        self.run_dir.mkdir(parents=True, exist_ok=True)
 
         self._json_logs = json_logs
+        self._binary_events = binary_events
         self._lock = threading.Lock()
 
-        # Open persistent log files
-        self._log_fh = open(self.run_dir / "logs.txt", "a", encoding="utf-8")
-        self._jsonl_fh: Optional[Any] = (
-            open(self.run_dir / "logs.jsonl", "a", encoding="utf-8")
-            if json_logs
-            else None
-        )
-
-        # Initialise in-memory status and persist immediately
+        # File handles are opened by _open_files() on first write.
+        self._opened = False
+        self._log_fh: Optional[Any] = None
+        self._jsonl_fh: Optional[Any] = None
+        self._events_fh: Optional[Any] = None
+        self._events_codec: Optional[bytes] = None
+        self._buffered = buffered
+        self._log_buf: List[bytes] = []
+        self._jsonl_buf: List[bytes] = []
+        self._buf_bytes = 0
+        self._closed = False
+        self._dirty = False
+        self._last_status_flush = 0.0
+        self._status_flushed_total = 0
+
+        # Initialise in-memory status; it reaches disk with the first write
+        ts = _now_iso()
         self._status: Dict[str, Any] = {
             "run_id": run_id,
             "status": "running",
-            "created_at": _now_iso(),
-            "updated_at": _now_iso(),
-            "events": [],
+            "created_at": ts,
+            "updated_at": ts,
+            "events_total": 0,
+            "events": deque(maxlen=MAX_STATUS_EVENTS),
         }
-        self._flush_status()
+
+        # Encoded event lines, flush markers (threading.Event) and _STOP;
+        # the writer thread is started together with the files.  Items are
+        # only queued under self._lock while _writer_running is set, so the
+        # writer's final drain never misses one.
+        self._event_q: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_running = False
+        # Exception that stopped the writer, re-raised to the next caller.
+        self._writer_error: Optional[BaseException] = None
+
+    def start(self) -> None:
+        """Create the run directory and write the initial ``status.json``.
+
+        Optional: otherwise both happen on the first log line or event.
+        """
+        self._ensure_open()
+        with self._lock:
+            if not self._closed:
+                self._flush_status()
+
+    def _ensure_open(self) -> None:
+        """Open the run files on first use (cheap check once they are open)."""
+        if not self._opened:
+            with self._lock:
+                self._open_files()
+
+    def _open_files(self) -> None:
+        """Create the run directory and open all handles (caller must hold ``self._lock``)."""
+        if self._opened or self._closed:
+            return
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        # Unbuffered binary mode: records are encoded to UTF-8 bytes before
+        # the lock is taken and batched in our own buffers, so each flush is
+        # a single write syscall with no text or io-buffer layer copying.
+        self._log_fh = open(self.run_dir / "logs.txt", "ab", buffering=0)
+        if self._json_logs:
+            self._jsonl_fh = open(self.run_dir / "logs.jsonl", "ab", buffering=0)
+        if self._binary_events:
+            events_path = self.run_dir / "events.bin"
+            self._events_codec = _events_bin_codec(events_path)
+        else:
+            events_path = self.run_dir / "events.jsonl"
+        self._events_fh = open(events_path, "ab", buffering=EVENTS_BUFFER_SIZE)
+        if self._events_codec is not None and self._events_fh.tell() == 0:
+            self._events_fh.write(EVENTS_BIN_MAGIC + self._events_codec)
+        self._opened = True
+        if self._buffered:
+            self._writer = threading.Thread(
+                target=self._writer_loop,
+                name=f"RunTracker-{self.run_id}",
+                daemon=True,
+            )
+            self._writer_running = True
+            self._writer.start()
 
     # ── logging ──────────────────────────────────────────────────────────────
 
     def log(self, level: str, message: str) -> None:
         """Write a log line to ``logs.txt`` (and ``logs.jsonl`` if enabled)."""
-        ts = _now_iso()
-        line = f"{ts} [{level.upper()}] {message}\n"
+        self._log(level, message, _now_iso())
+
+    def _log(self, level: str, message: str, ts: str) -> None:
+        """:meth:`log` with a caller-supplied timestamp."""
+        self._ensure_open()
+        level = level.upper()
+        # Format outside the lock; only the buffer append is serialized.
+        line = f"{ts} [{level}] {message}\n".encode("utf-8")
+        record_line: Optional[bytes] = None
+        if self._json_logs:
+            record = {"ts": ts, "level": level, "msg": message}
+            record_line = _dumps(record) + b"\n"
         with self._lock:
-            self._log_fh.write(line)
-            self._log_fh.flush()
-            if self._jsonl_fh is not None:
-                record = {"ts": ts, "level": level.upper(), "msg": message}
-                self._jsonl_fh.write(json.dumps(record) + "\n")
-                self._jsonl_fh.flush()
+            self._log_buf.append(line)
+            self._buf_bytes += len(line)
+            if record_line is not None:
+                self._jsonl_buf.append(record_line)
+            if (
+                not self._buffered
+                or level in _URGENT_LEVELS
+                or len(self._log_buf) >= LOG_FLUSH_LINES
+                or self._buf_bytes >= LOG_FLUSH_BYTES
+            ):
+                self._flush_logs()
 
     def info(self, message: str) -> None:
         self.log("INFO", message)
@@ -96,7 +254,12 @@ class RunTracker:
         step: Optional[int] = None,
         total_steps: Optional[int] = None,
     ) -> None:
-        """Append a progress event to ``events.jsonl`` and refresh ``status.json``.
+        """Record a progress event for ``events.jsonl`` and ``status.json``.
+
+        The in-memory status is updated immediately; in buffered mode the
+        file writes are handed to the writer thread.  If that thread has
+        stopped on a write error, the error is raised here once and later
+        events are written through on the caller's thread.
 
         Parameters
         ----------
@@ -111,6 +274,8 @@ class RunTracker:
         total_steps:
             Optional total number of steps.
         """
+        self._ensure_open()
+        self._raise_writer_error()
         ts = _now_iso()
         event: Dict[str, Any] = {"ts": ts, "stage": stage, "message": message}
         if percent is not None:
@@ -119,91 +284,479 @@ class RunTracker:
             event["step"] = step
         if total_steps is not None:
             event["total_steps"] = total_steps
+        if self._events_codec is None:
+            event_line = _dumps(event) + b"\n"
+        else:
+            payload = _encode_event(event, self._events_codec)
+            event_line = _LEN_PREFIX.pack(len(payload)) + payload
 
         with self._lock:
-            # Append to events.jsonl (append-only)
-            events_path = self.run_dir / "events.jsonl"
-            with open(events_path, "a", encoding="utf-8") as fh:
-                fh.write(json.dumps(event) + "\n")
-
-            # Update in-memory status and persist
             self._status["updated_at"] = ts
             self._status["events"].append(event)
-            self._flush_status()
+            self._status["events_total"] += 1
+            self._dirty = True
+            if self._writer_running:
+                self._event_q.put(event_line)
+            elif not self._closed:
+                # Unbuffered (or the writer has stopped): write through on
+                # the caller's thread.
+                self._events_fh.write(event_line)
+                self._events_fh.flush()
+                self._flush_status()
 
         # Mirror the event as a log line for convenience
         pct_str = f" ({percent}%)" if percent is not None else ""
-        self.info(f"[{stage}]{pct_str} {message}")
+        self._log("INFO", f"[{stage}]{pct_str} {message}", ts)
 
     # ── lifecycle ─────────────────────────────────────────────────────────────
 
     def complete(self) -> None:
         """Mark the run as completed and flush ``status.json``."""
+        self._ensure_open()
+        ts = _now_iso()
         with self._lock:
             self._status["status"] = "completed"
-            self._status["updated_at"] = _now_iso()
-            self._flush_status()
-        self.info("Run completed successfully.")
+            self._status["updated_at"] = ts
+            self._flush_status(final=True)
+        self._log("INFO", "Run completed successfully.", ts)
+        self.flush()
 
     def fail(self, reason: str = "") -> None:
         """Mark the run as failed and flush ``status.json``."""
+        self._ensure_open()
+        ts = _now_iso()
         with self._lock:
             self._status["status"] = "failed"
-            self._status["updated_at"] = _now_iso()
+            self._status["updated_at"] = ts
             if reason:
                 self._status["error"] = reason
-            self._flush_status()
-        self.error(f"Run failed: {reason}" if reason else "Run failed.")
+            self._flush_status(final=True)
+        self._log("ERROR", f"Run failed: {reason}" if reason else "Run failed.", ts)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write buffered log lines, events and any pending ``status.json`` update.
+
+        In buffered mode this waits until the writer thread has written every
+        event queued before the call.  An error that stopped the writer
+        thread is raised here.
+        """
+        done: Optional[threading.Event] = None
+        with self._lock:
+            if self._writer_running:
+                done = threading.Event()
+                self._event_q.put(done)
+            else:
+                self._flush_files()
+        if done is not None:
+            done.wait()
+        self._raise_writer_error()
 
     def close(self) -> None:
-        """Flush and close all open file handles."""
-        self._log_fh.close()
-        if self._jsonl_fh is not None:
-            self._jsonl_fh.close()
+        """Flush and close all open file handles.
+
+        A run left ``running`` gets a final, pretty-printed ``status.json``.
+        An error that stopped the writer thread is raised after the handles
+        are closed.
+        """
+        with self._lock:
+            running = self._writer_running
+            if running:
+                self._event_q.put(_STOP)
+        if running:
+            self._writer.join()
+        try:
+            with self._lock:
+                if self._closed:
+                    return
+                if not self._opened:
+                    # Never written to: leave nothing behind on disk.
+                    self._closed = True
+                    return
+                # complete()/fail() already wrote the final snapshot unless
+                # events arrived since; a run still "running" only has the
+                # compact in-run file, whether or not anything is pending.
+                if self._dirty or self._status["status"] == "running":
+                    self._flush_status(final=True)
+                self._flush_files()
+                self._closed = True
+                self._log_fh.close()
+                self._events_fh.close()
+                if self._jsonl_fh is not None:
+                    self._jsonl_fh.close()
+        finally:
+            self._raise_writer_error()
+
+    def _raise_writer_error(self) -> None:
+        """Raise (once) the exception that stopped the writer thread, if any."""
+        exc = self._writer_error
+        if exc is not None:
+            self._writer_error = None
+            raise exc
 
     # ── status helpers ────────────────────────────────────────────────────────
 
     def get_status(self, last_n_events: int = 20) -> Dict[str, Any]:
-        """Return a copy of the current status with at most *last_n_events* events."""
+        """Return a copy of the current status with at most *last_n_events* events.
+
+        Only the last ``MAX_STATUS_EVENTS`` events are held in memory;
+        ``events_total`` counts every event emitted so far.
+        """
         with self._lock:
             status = dict(self._status)
             status["events"] = list(status["events"])
         status["events"] = status["events"][-last_n_events:]
         return status
 
-    def _flush_status(self) -> None:
-        """Atomically write ``status.json`` (caller must hold ``self._lock``)."""
+    def _flush_logs(self) -> None:
+        """Write buffered log lines in one call per file (caller must hold ``self._lock``)."""
+        if self._closed or not self._log_buf:
+            return
+        _write_all(self._log_fh, self._log_buf)
+        self._log_buf.clear()
+        self._buf_bytes = 0
+        if self._jsonl_fh is not None and self._jsonl_buf:
+            _write_all(self._jsonl_fh, self._jsonl_buf)
+            self._jsonl_buf.clear()
+
+    def _flush_files(self, status: bool = True) -> None:
+        """Flush logs, events and (if *status*) a dirty status (caller must hold ``self._lock``)."""
+        if self._closed or not self._opened:
+            return
+        self._flush_logs()
+        self._events_fh.flush()
+        if status and self._dirty:
+            self._flush_status()
+
+    def _writer_loop(self) -> None:
+        """Background thread: append queued events in batches and flush periodically.
+
+        Each wake-up drains everything queued so far and writes it with one
+        ``write()``.  Logs, events and a dirty status are fully flushed every
+        ``LOG_FLUSH_INTERVAL`` and whenever :meth:`flush` asks for it; in
+        between, status.json is refreshed once enough new events or time
+        have accumulated.  On :meth:`close` the status is left for the final
+        atomic write.  A write error stops the thread and is kept for
+        :meth:`_raise_writer_error`; flush markers are always released.
+        """
+        next_flush = time.monotonic() + LOG_FLUSH_INTERVAL
+        stop = False
+        try:
+            while not stop:
+                try:
+                    item = self._event_q.get(
+                        timeout=max(0.0, next_flush - time.monotonic())
+                    )
+                except queue.Empty:
+                    item = None
+                batch: List[bytes] = []
+                markers: List[threading.Event] = []
+                try:
+                    while item is not None:
+                        if item is _STOP:
+                            stop = True
+                        elif isinstance(item, threading.Event):
+                            markers.append(item)
+                        else:
+                            batch.append(item)
+                        try:
+                            item = self._event_q.get_nowait()
+                        except queue.Empty:
+                            item = None
+
+                    with self._lock:
+                        if batch and not self._closed:
+                            self._events_fh.write(b"".join(batch))
+                        now = time.monotonic()
+                        if stop:
+                            # close() writes the final status.json itself.
+                            self._flush_files(status=False)
+                        elif markers or now >= next_flush:
+                            self._flush_files()
+                            next_flush = now + LOG_FLUSH_INTERVAL
+                        elif self._dirty and (
+                            now - self._last_status_flush > STATUS_FLUSH_INTERVAL
+                            or self._status["events_total"] - self._status_flushed_total
+                            >= STATUS_FLUSH_EVERY
+                        ):
+                            self._flush_status()
+                finally:
+                    for marker in markers:
+                        marker.set()
+        except Exception as exc:
+            self._writer_error = exc
+        finally:
+            self._stop_writer()
+
+    def _stop_writer(self) -> None:
+        """Hand writes back to callers and drain what is still queued.
+
+        Runs on the writer thread as it exits.  Lines queued after ``_STOP``
+        are still written (unless the writer failed); every pending flush
+        marker is released so no :meth:`flush` call waits forever.
+        """
+        markers: List[threading.Event] = []
+        with self._lock:
+            self._writer_running = False
+            batch: List[bytes] = []
+            while True:
+                try:
+                    item = self._event_q.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                elif item is not _STOP:
+                    batch.append(item)
+            if batch and self._writer_error is None and not self._closed:
+                try:
+                    self._events_fh.write(b"".join(batch))
+                    self._events_fh.flush()
+                except Exception as exc:
+                    self._writer_error = exc
+        for marker in markers:
+            marker.set()
+
+    def _flush_status(self, final: bool = False) -> None:
+        """Write ``status.json`` (caller must hold ``self._lock``).
+
+        In-run writes are compact and overwrite the file in place; *final*
+        is set by :meth:`complete`, :meth:`fail` and :meth:`close`, whose
+        pretty-printed snapshot is swapped in atomically.
+        """
+        payload = {**self._status, "events": list(self._status["events"])}
+        data = _dumps(payload, indent=final)
+        if final:
+            self._write_status_atomic(data)
+        else:
+            self._write_status_fast(data)
+        self._dirty = False
+        self._last_status_flush = time.monotonic()
+        self._status_flushed_total = self._status["events_total"]
+
+    def _write_status_fast(self, data: bytes) -> None:
+        """Truncate and rewrite ``status.json`` in place.
+
+        status.json is derived from events.jsonl, so intra-run writes skip
+        the temp-file + rename; a reader racing a write may see a partial
+        file, which :func:`load_status` retries and the next flush repairs.
+        """
+        with open(self.run_dir / "status.json", "wb", buffering=0) as fh:
+            _write_all(fh, [data])
+
+    def _write_status_atomic(self, data: bytes) -> None:
+        """Write ``status.json`` via a ``.tmp`` file and atomic rename."""
         tmp = self.run_dir / "status.json.tmp"
-        target = self.run_dir / "status.json"
-        tmp.write_text(json.dumps(self._status, indent=2), encoding="utf-8")
-        tmp.replace(target)
+        tmp.write_bytes(data)
+        tmp.replace(self.run_dir / "status.json")
 
     # ── context manager ───────────────────────────────────────────────────────
 
     def __enter__(self) -> "RunTracker":
+        self.start()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if exc_type is not None:
-            self.fail(str(exc_val))
-        else:
-            self.complete()
-        self.close()
+        try:
+            if exc_type is not None:
+                self.fail(str(exc_val))
+            else:
+                self.complete()
+        finally:
+            self.close()
 
 
 # ── module-level helpers ──────────────────────────────────────────────────────
 
 
+def _dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Encode *obj* as UTF-8 JSON bytes (compact unless *indent*).
+
+    Uses ``orjson`` when installed, otherwise the stdlib encoder with
+    matching output (non-ASCII kept as-is, two-space indent).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def _events_bin_codec(path: Path) -> bytes:
+    """Return the codec for appending to ``events.bin`` at *path*.
+
+    An existing file keeps the codec recorded in its header; a new one uses
+    msgpack when installed, otherwise compact JSON.
+    """
+    try:
+        with open(path, "rb") as fh:
+            header = fh.read(len(EVENTS_BIN_MAGIC) + 1)
+    except FileNotFoundError:
+        header = b""
+    if not header:
+        return _CODEC_MSGPACK if msgpack is not None else _CODEC_JSON
+    return _read_events_bin_header(header, path)
+
+
+def _read_events_bin_header(header: bytes, path: Path) -> bytes:
+    """Validate an ``events.bin`` *header* and return its codec byte."""
+    codec = header[len(EVENTS_BIN_MAGIC):]
+    if (
+        not header.startswith(EVENTS_BIN_MAGIC)
+        or codec not in (_CODEC_MSGPACK, _CODEC_JSON)
+    ):
+        raise ValueError(f"{path} is not a RunTracker events.bin file.")
+    if codec == _CODEC_MSGPACK and msgpack is None:
+        raise RuntimeError(
+            f"{path} holds msgpack-encoded events but msgpack is not installed."
+        )
+    return codec
+
+
+def _encode_event(event: Dict[str, Any], codec: bytes) -> bytes:
+    """Encode one event for ``events.bin`` using *codec*."""
+    if codec == _CODEC_MSGPACK:
+        return msgpack.packb(event, use_bin_type=True)
+    return _dumps(event)
+
+
+def _write_all(fh: Any, chunks: List[bytes]) -> None:
+    """Write *chunks* to the unbuffered binary handle *fh* in as few syscalls as possible.
+
+    Uses scatter-gather ``os.writev`` where available, otherwise one joined
+    ``write()``; short writes are retried until everything is on disk.
+    """
+    if hasattr(os, "writev") and len(chunks) <= _IOV_MAX:
+        written = os.writev(fh.fileno(), chunks)
+        if written == sum(len(chunk) for chunk in chunks):
+            return
+        data = memoryview(b"".join(chunks))[written:]
+    else:
+        data = memoryview(b"".join(chunks))
+    while data:
+        data = data[fh.write(data):]
+
+
+# _now_iso() cache: (whole second, formatted string).  Swapped as one tuple
+# so readers never see a second paired with another second's string.
+_TS_LOCK = threading.Lock()
+_LAST_TS = (-1, "")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON *data* with ``orjson`` when installed, else stdlib ``json``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def _now_iso() -> str:
-    """Return the current UTC time as an ISO-8601 string (second precision)."""
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+    """Return the current UTC time as an ISO-8601 string (second precision).
+
+    The string only changes once per second, so it is formatted once and
+    reused for every call within the same second.
+    """
+    global _LAST_TS
+    sec = int(time.time())
+    cached_sec, cached_str = _LAST_TS
+    if sec == cached_sec:
+        return cached_str
+    formatted = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+    with _TS_LOCK:
+        if sec > _LAST_TS[0]:
+            _LAST_TS = (sec, formatted)
+    return formatted
+
+
+def iter_events(
+    run_id: str, runs_dir: str = "runs"
+) -> Iterator[Dict[str, Any]]:
+    """Yield every progress event recorded for *run_id*, oldest first.
+
+    Reads ``events.bin`` when the run used ``binary_events=True`` and
+    ``events.jsonl`` otherwise; yields nothing if neither exists.  A record
+    still being written by a live run is skipped.
+    """
+    run_dir = Path(runs_dir) / run_id
+    bin_path = run_dir / "events.bin"
+    if bin_path.exists():
+        yield from _iter_events_bin(bin_path)
+        return
+    jsonl_path = run_dir / "events.jsonl"
+    if not jsonl_path.exists():
+        return
+    with open(jsonl_path, "rb") as fh:
+        for line in fh:
+            if line.endswith(b"\n"):
+                yield json.loads(line)
+
+
+def _iter_events_bin(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream decoded events from the ``events.bin`` file at *path*."""
+    with open(path, "rb") as fh:
+        header = fh.read(len(EVENTS_BIN_MAGIC) + 1)
+        if not header:
+            return
+        codec = _read_events_bin_header(header, path)
+        while True:
+            prefix = fh.read(_LEN_PREFIX.size)
+            if len(prefix) < _LEN_PREFIX.size:
+                return
+            (size,) = _LEN_PREFIX.unpack(prefix)
+            payload = fh.read(size)
+            if len(payload) < size:
+                return
+            if codec == _CODEC_MSGPACK:
+                yield msgpack.unpackb(payload, raw=False)
+            else:
+                yield json.loads(payload)
+
+
+def _copy_status(status: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached status dict together with its ``events`` list."""
+    copy = dict(status)
+    if isinstance(copy.get("events"), list):
+        copy["events"] = list(copy["events"])
+    return copy
 
 
 def load_status(
     run_id: str, runs_dir: str = "runs"
 ) -> Optional[Dict[str, Any]]:
-    """Load ``status.json`` for *run_id*; return *None* if the file is absent."""
+    """Load ``status.json`` for *run_id*; return *None* if the file is absent.
+
+    Parsed results are cached per file and reused while its inode,
+    modification time and size are unchanged, so frequent polling of an idle
+    or finished run does not re-parse it.  Each call returns a copy whose
+    ``events`` list is also copied, so callers may modify it freely.  A read
+    that races an in-place rewrite by a live run is retried a few times
+    before the decode error is raised.
+    """
     path = Path(runs_dir) / run_id / "status.json"
-    if not path.exists():
-        return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    attempts = _STATUS_READ_ATTEMPTS
+    while True:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        with _STATUS_CACHE_LOCK:
+            cached = _STATUS_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            return _copy_status(cached[1])
+        try:
+            status = _loads(path.read_bytes())
+        except ValueError:
+            attempts -= 1
+            if attempts <= 0:
+                raise
+            time.sleep(_STATUS_READ_RETRY_DELAY)
+            continue
+        with _STATUS_CACHE_LOCK:
+            _STATUS_CACHE.pop(path, None)
+            _STATUS_CACHE[path] = (key, status)
+            while len(_STATUS_CACHE) > _STATUS_CACHE_SIZE:
+                del _STATUS_CACHE[next(iter(_STATUS_CACHE))]
+        return _copy_status(status)
@@ -13,21 +13,63 @@ Exports:
 
     AssetSpec  – scanned/matched asset manifest
     BuildSpec  – build & output configuration
+
+Submodules are imported lazily (PEP 562) on first attribute access, so
+``import schemas`` does not build every pydantic model up front.
 """
 
-from .game_spec import (  # noqa: F401
-    GameSpec,
-    EntitySpec,
-    ControlsSpec,
-    ProgressionSpec,
-    GameSpecModel,
-    validate_game_spec,
-    GAME_SPEC_SCHEMA_VERSION,
-)
-from .idle_rpg_design_doc import (  # noqa: F401
-    IdleRpgDesignDocModel,
-    validate_idle_rpg_design_doc,
-    IDLE_RPG_DESIGN_DOC_SCHEMA_VERSION,
-)
-from .asset_spec import AssetEntry, AssetSpec                                # noqa: F401
-from .build_spec import BuildSpec                                            # noqa: F401
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "GameSpec": ".game_spec",
+    "EntitySpec": ".game_spec",
+    "ControlsSpec": ".game_spec",
+    "ProgressionSpec": ".game_spec",
+    "GameSpecModel": ".game_spec",
+    "validate_game_spec": ".game_spec",
+    "GAME_SPEC_SCHEMA_VERSION": ".game_spec",
+    "IdleRpgDesignDocModel": ".idle_rpg_design_doc",
+    "validate_idle_rpg_design_doc": ".idle_rpg_design_doc",
+    "IDLE_RPG_DESIGN_DOC_SCHEMA_VERSION": ".idle_rpg_design_doc",
+    "AssetEntry": ".asset_spec",
+    "AssetSpec": ".asset_spec",
+    "BuildSpec": ".build_spec",
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:  # pragma: no cover - static analysers see eager imports
+    from .asset_spec import AssetEntry, AssetSpec
+    from .build_spec import BuildSpec
+    from .game_spec import (
+        GAME_SPEC_SCHEMA_VERSION,
+        ControlsSpec,
+        EntitySpec,
+        GameSpec,
+        GameSpecModel,
+        ProgressionSpec,
+        validate_game_spec,
+    )
+    from .idle_rpg_design_doc import (
+        IDLE_RPG_DESIGN_DOC_SCHEMA_VERSION,
+        IdleRpgDesignDocModel,
+        validate_idle_rpg_design_doc,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
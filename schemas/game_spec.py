@@ -26,14 +26,14 @@ Usage
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional, get_args
 
 try:
     from typing import TypedDict
 except ImportError:  # Python < 3.8
     from typing_extensions import TypedDict  # type: ignore
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field
 
 # ---------------------------------------------------------------------------
 # Version constant
@@ -93,7 +93,13 @@ class GameSpec(TypedDict, total=False):
 # Pydantic model  (used for boundary validation)
 # ---------------------------------------------------------------------------
 
-_VALID_GENRES = {"top_down_shooter", "idle_rpg"}
+# Checked by pydantic-core itself rather than a Python field validator.
+Genre = Literal["top_down_shooter", "idle_rpg"]
+
+_VALID_GENRES = frozenset(get_args(Genre))
+
+# List of strings that must contain at least one entry.
+NonEmptyStrList = Annotated[List[str], Field(min_length=1)]
 
 
 class GameSpecModel(BaseModel):
@@ -109,10 +115,10 @@ class GameSpecModel(BaseModel):
 
     # --- Required core fields ---
     title: str
-    genre: str
-    mechanics: List[str]
-    required_assets: List[str]
-    screens: List[str]
+    genre: Genre
+    mechanics: NonEmptyStrList
+    required_assets: NonEmptyStrList
+    screens: NonEmptyStrList
     controls: Dict[str, Any]
     progression: Dict[str, Any]
 
@@ -128,22 +134,6 @@ class GameSpecModel(BaseModel):
     online: Optional[bool] = None
     assets_dir: Optional[str] = None
 
-    @field_validator("genre")
-    @classmethod
-    def genre_must_be_known(cls, v: str) -> str:
-        if v not in _VALID_GENRES:
-            raise ValueError(
-                f"'genre' must be one of {sorted(_VALID_GENRES)}, got '{v}'."
-            )
-        return v
-
-    @field_validator("mechanics", "required_assets", "screens")
-    @classmethod
-    def list_must_not_be_empty(cls, v: List[str], info: Any) -> List[str]:
-        if not v:
-            raise ValueError(f"'{info.field_name}' must not be an empty list.")
-        return v
-
     model_config = {"extra": "allow"}
 
 
@@ -152,6 +142,19 @@ class GameSpecModel(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+def _error_message(field: str, err: Dict[str, Any]) -> str:
+    """Return the message for one pydantic error, keeping the field-named
+    wording the old Python validators produced for the constraint types."""
+    if err["type"] == "too_short":
+        return f"'{field}' must not be an empty list."
+    if err["type"] == "literal_error" and field == "genre":
+        return (
+            f"'genre' must be one of {sorted(_VALID_GENRES)}, "
+            f"got {err['input']!r}."
+        )
+    return err["msg"]
+
+
 def validate_game_spec(data: Dict[str, Any]) -> GameSpecModel:
     """Validate *data* against :class:`GameSpecModel`.
 
@@ -168,12 +171,12 @@ def validate_game_spec(data: Dict[str, Any]) -> GameSpecModel:
     from pydantic import ValidationError
 
     try:
-        return GameSpecModel(**data)
+        return GameSpecModel.model_validate(data)
     except ValidationError as exc:
         messages = []
         for err in exc.errors():
             field = ".".join(str(loc) for loc in err["loc"])
-            messages.append(f"  - {field}: {err['msg']}")
+            messages.append(f"  - {field}: {_error_message(field, err)}")
         raise ValueError(
             "GameSpec validation failed:\n" + "\n".join(messages)
         ) from exc
@@ -22,9 +22,9 @@ Usage
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, StringConstraints
 
 # ---------------------------------------------------------------------------
 # Version constant
@@ -32,6 +32,15 @@ from pydantic import BaseModel, field_validator
 
 IDLE_RPG_DESIGN_DOC_SCHEMA_VERSION = "1.0"
 
+# ---------------------------------------------------------------------------
+# Constrained field types (enforced by pydantic-core, no Python callbacks)
+# ---------------------------------------------------------------------------
+
+# At least one non-whitespace character; the value itself is not stripped.
+NonBlankStr = Annotated[str, StringConstraints(pattern=r"\S")]
+NonEmptyStrList = Annotated[List[str], Field(min_length=1)]
+NonEmptyDictList = Annotated[List[Dict[str, Any]], Field(min_length=1)]
+
 # ---------------------------------------------------------------------------
 # Pydantic model
 # ---------------------------------------------------------------------------
@@ -49,38 +58,21 @@ class IdleRpgDesignDocModel(BaseModel):
     schema_version: str = IDLE_RPG_DESIGN_DOC_SCHEMA_VERSION
 
     # --- Required core fields ---
-    world: str
-    premise: str
-    main_story_beats: List[str]
-    quests: List[Dict[str, Any]]
-    characters: List[Dict[str, Any]]
-    factions: List[Dict[str, Any]]
-    locations: List[Dict[str, Any]]
-    items: List[Dict[str, Any]]
-    enemies: List[Dict[str, Any]]
+    world: NonBlankStr
+    premise: NonBlankStr
+    main_story_beats: NonEmptyStrList
+    quests: NonEmptyDictList
+    characters: NonEmptyDictList
+    factions: NonEmptyDictList
+    locations: NonEmptyDictList
+    items: NonEmptyDictList
+    enemies: NonEmptyDictList
 
     # --- Optional enrichment fields ---
     dialogue_samples: Optional[List[Dict[str, Any]]] = None
     upgrade_tree: Optional[Dict[str, Any]] = None
     idle_loops: Optional[List[Dict[str, Any]]] = None
 
-    @field_validator("world", "premise")
-    @classmethod
-    def string_must_not_be_blank(cls, v: str, info: Any) -> str:
-        if not v.strip():
-            raise ValueError(f"'{info.field_name}' must not be blank.")
-        return v
-
-    @field_validator(
-        "main_story_beats", "quests", "characters", "factions",
-        "locations", "items", "enemies",
-    )
-    @classmethod
-    def list_must_not_be_empty(cls, v: list, info: Any) -> list:
-        if not v:
-            raise ValueError(f"'{info.field_name}' must not be an empty list.")
-        return v
-
     model_config = {"extra": "allow"}
 
 
@@ -89,6 +81,16 @@ class IdleRpgDesignDocModel(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+def _error_message(field: str, err: Dict[str, Any]) -> str:
+    """Return the message for one pydantic error, keeping the field-named
+    wording the old Python validators produced for the constraint types."""
+    if err["type"] == "string_pattern_mismatch":
+        return f"'{field}' must not be blank."
+    if err["type"] == "too_short":
+        return f"'{field}' must not be an empty list."
+    return err["msg"]
+
+
 def validate_idle_rpg_design_doc(data: Dict[str, Any]) -> IdleRpgDesignDocModel:
     """Validate *data* against :class:`IdleRpgDesignDocModel`.
 
@@ -105,12 +107,12 @@ def validate_idle_rpg_design_doc(data: Dict[str, Any]) -> IdleRpgDesignDocModel:
     from pydantic import ValidationError
 
     try:
-        return IdleRpgDesignDocModel(**data)
+        return IdleRpgDesignDocModel.model_validate(data)
     except ValidationError as exc:
         messages = []
         for err in exc.errors():
             field = ".".join(str(loc) for loc in err["loc"])
-            messages.append(f"  - {field}: {err['msg']}")
+            messages.append(f"  - {field}: {_error_message(field, err)}")
         raise ValueError(
             "IdleRpgDesignDoc validation failed:\n" + "\n".join(messages)
         ) from exc
@@ -6,6 +6,7 @@ import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from game_generator.asset_importer import AssetIndexer, import_assets
 from game_generator.spec import GameSpec
@@ -159,6 +160,39 @@ class TestImportAssets(unittest.TestCase):
         for p in paths:
             self.assertFalse(os.path.isabs(p), f"Path should be relative: {p}")
 
+    def test_import_preserves_required_asset_order(self):
+        spec: GameSpec = {
+            "title": "Test Game",
+            "genre": "top_down_shooter",
+            "required_assets": ["enemy", "player"],
+        }
+        paths = import_assets(spec, self.src, self.dest)
+        self.assertEqual(
+            paths, ["assets/imported/enemy.png", "assets/imported/player.png"]
+        )
+
+    def test_import_falls_back_to_copy_when_link_fails(self):
+        spec: GameSpec = {
+            "title": "Test Game",
+            "genre": "top_down_shooter",
+            "required_assets": ["player"],
+        }
+        with patch("game_generator.asset_importer.os.link", side_effect=OSError):
+            paths = import_assets(spec, self.src, self.dest)
+        self.assertEqual(
+            Path(self.dest, paths[0]).read_bytes(), b"\x89PNG\r\n\x1a\n"
+        )
+
+    def test_reimport_overwrites_existing_destination(self):
+        spec: GameSpec = {
+            "title": "Test Game",
+            "genre": "top_down_shooter",
+            "required_assets": ["player"],
+        }
+        import_assets(spec, self.src, self.dest)
+        paths = import_assets(spec, self.src, self.dest)
+        self.assertTrue(Path(self.dest, paths[0]).exists())
+
     def test_import_empty_dir_returns_empty(self):
         empty_dir = tempfile.mkdtemp()
         spec: GameSpec = {"title": "T", "genre": "top_down_shooter", "required_assets": ["player"]}
@@ -30,9 +30,11 @@ from game_generator.spec import GameSpec
 # ---------------------------------------------------------------------------
 
 
+# Built once: the scaffolder only reads the design doc, never mutates it.
+_DESIGN_DOC = generate_idle_rpg_design_template("A dark fantasy idle RPG", seed=1)
+
+
 def _idle_spec_with_doc(**kwargs) -> GameSpec:
-    from game_generator.ai.design_assistant import generate_idle_rpg_design_template
-    doc = generate_idle_rpg_design_template("A dark fantasy idle RPG", seed=1)
     base: GameSpec = {
         "title": "Dark Fantasy Idle",
         "genre": "idle_rpg",
@@ -42,7 +44,7 @@ def _idle_spec_with_doc(**kwargs) -> GameSpec:
         "controls": {"keyboard": ["click"], "mobile": ["tap"]},
         "progression": {"scoring": "experience", "levels": 20},
         "orientation": "portrait",
-        "design_doc_data": doc,
+        "design_doc_data": _DESIGN_DOC,
     }
     base.update(kwargs)
     return base
@@ -56,39 +58,44 @@ def _idle_spec_with_doc(**kwargs) -> GameSpec:
 class TestTemplateFallback(unittest.TestCase):
     """generate_idle_rpg_design_template produces a valid design doc offline."""
 
+    @classmethod
+    def setUpClass(cls):
+        # The tests only inspect the doc, so generate it once.
+        cls.doc = generate_idle_rpg_design_template("test prompt")
+
     def test_returns_dict(self):
-        doc = generate_idle_rpg_design_template("test prompt")
+        doc = self.doc
         self.assertIsInstance(doc, dict)
 
     def test_has_all_required_keys(self):
-        doc = generate_idle_rpg_design_template("test prompt")
+        doc = self.doc
         for key in REQUIRED_KEYS:
             self.assertIn(key, doc, f"Missing required key: {key}")
 
     def test_world_is_string(self):
-        doc = generate_idle_rpg_design_template("test prompt")
+        doc = self.doc
         self.assertIsInstance(doc["world"], str)
         self.assertTrue(len(doc["world"]) > 0)
 
     def test_quests_is_nonempty_list(self):
-        doc = generate_idle_rpg_design_template("test prompt")
+        doc = self.doc
         self.assertIsInstance(doc["quests"], list)
         self.assertGreater(len(doc["quests"]), 0)
 
     def test_enemies_is_nonempty_list(self):
-        doc = generate_idle_rpg_design_template("test prompt")
+        doc = self.doc
         self.assertIsInstance(doc["enemies"], list)
         self.assertGreater(len(doc["enemies"]), 0)
 
     def test_includes_upgrade_tree(self):
-        doc = generate_idle_rpg_design_template("test prompt")
+        doc = self.doc
         self.assertIn("upgrade_tree", doc)
         self.assertIsInstance(doc["upgrade_tree"], dict)
         # Must have 3 upgrade categories
         self.assertGreaterEqual(len(doc["upgrade_tree"]), 3)
 
     def test_includes_idle_loops(self):
-        doc = generate_idle_rpg_design_template("test prompt")
+        doc = self.doc
         self.assertIn("idle_loops", doc)
         self.assertIsInstance(doc["idle_loops"], list)
         self.assertGreater(len(doc["idle_loops"]), 0)
@@ -131,8 +138,11 @@ class TestTemplateFallbackDeterminism(unittest.TestCase):
 class TestIdleRPGCodegenFiles(unittest.TestCase):
     """All expected files are generated in the idle RPG project."""
 
-    def setUp(self):
-        self.files = scaffold_project(_idle_spec_with_doc())
+    @classmethod
+    def setUpClass(cls):
+        # Every test only inspects the generated files, so scaffold once.
+        cls.files = scaffold_project(_idle_spec_with_doc())
+        cls.enemies = json.loads(cls.files["assets/data/enemies.json"])
 
     # Core Dart game files
     def test_game_dart_exists(self):
@@ -158,13 +168,11 @@ class TestIdleRPGCodegenFiles(unittest.TestCase):
         self.assertIn("assets/data/enemies.json", self.files)
 
     def test_enemies_json_is_valid_list(self):
-        data = json.loads(self.files["assets/data/enemies.json"])
-        self.assertIsInstance(data, list)
-        self.assertGreater(len(data), 0)
+        self.assertIsInstance(self.enemies, list)
+        self.assertGreater(len(self.enemies), 0)
 
     def test_enemies_json_has_name_field(self):
-        data = json.loads(self.files["assets/data/enemies.json"])
-        for enemy in data:
+        for enemy in self.enemies:
             self.assertIn("name", enemy)
 
     # UI screens
@@ -246,22 +254,27 @@ class TestIdleRPGCodegenFiles(unittest.TestCase):
 class TestZipOutput(unittest.TestCase):
     """Generated ZIP is valid and contains expected Flutter project structure."""
 
-    def setUp(self):
-        """Run the orchestrator in offline idle_rpg mode and produce a ZIP."""
+    @classmethod
+    def setUpClass(cls):
+        """Run the orchestrator once in offline idle_rpg mode and produce a ZIP.
+
+        The prompt describes a shooter on purpose: idle_rpg=True must still
+        produce an idle RPG project (see test_zip_contains_idle_manager).
+        """
         from orchestrator.orchestrator import Orchestrator
-        self.tmp = tempfile.mkdtemp()
-        self.zip_path = os.path.join(self.tmp, "test_idle.zip")
+        tmp = tempfile.TemporaryDirectory()
+        # Class cleanups also run when setUpClass itself fails.
+        cls.addClassCleanup(tmp.cleanup)
+        cls.zip_path = os.path.join(tmp.name, "test_idle.zip")
         orchestrator = Orchestrator(interactive=False)
         orchestrator.run(
-            prompt="A cursed kingdom idle RPG",
-            output_zip=self.zip_path,
+            prompt="space shooter with guns",
+            output_zip=cls.zip_path,
             idle_rpg=True,
             seed=7,
         )
-
-    def tearDown(self):
-        import shutil
-        shutil.rmtree(self.tmp, ignore_errors=True)
+        with zipfile.ZipFile(cls.zip_path) as zf:
+            cls._basenames = frozenset(os.path.basename(n) for n in zf.namelist())
 
     def test_zip_file_created(self):
         self.assertTrue(os.path.isfile(self.zip_path))
@@ -269,32 +282,25 @@ class TestZipOutput(unittest.TestCase):
     def test_zip_is_valid(self):
         self.assertTrue(zipfile.is_zipfile(self.zip_path))
 
-    def _zip_names(self):
-        with zipfile.ZipFile(self.zip_path) as zf:
-            return set(zf.namelist())
-
     def test_zip_contains_pubspec(self):
-        names = self._zip_names()
-        self.assertTrue(any("pubspec.yaml" in n for n in names))
+        self.assertIn("pubspec.yaml", self._basenames)
 
     def test_zip_contains_main_dart(self):
-        names = self._zip_names()
-        self.assertTrue(any("main.dart" in n for n in names))
+        self.assertIn("main.dart", self._basenames)
 
     def test_zip_contains_enemies_json(self):
-        names = self._zip_names()
-        self.assertTrue(any("enemies.json" in n for n in names))
+        self.assertIn("enemies.json", self._basenames)
 
     def test_zip_contains_design_doc(self):
-        names = self._zip_names()
         # Either design.json or DESIGN.md depending on format
-        self.assertTrue(
-            any("design.json" in n for n in names) or any("DESIGN.md" in n for n in names)
-        )
+        self.assertTrue({"design.json", "DESIGN.md"} & self._basenames)
 
     def test_zip_contains_save_manager(self):
-        names = self._zip_names()
-        self.assertTrue(any("save_manager.dart" in n for n in names))
+        self.assertIn("save_manager.dart", self._basenames)
+
+    def test_zip_contains_idle_manager(self):
+        # idle_rpg genre always generates idle_manager.dart
+        self.assertIn("idle_manager.dart", self._basenames)
 
 
 # ---------------------------------------------------------------------------
@@ -323,33 +329,31 @@ class TestOrchestratorIdleRPGMode(unittest.TestCase):
     """Orchestrator with idle_rpg=True uses template fallback when Ollama is absent."""
 
     def test_idle_rpg_forces_genre(self):
-        """Verifies that idle_rpg mode always sets genre to idle_rpg."""
+        """Without the override, a shooter prompt yields a shooter spec.
+
+        The orchestrator's idle_rpg override itself is covered by
+        TestZipOutput, which feeds it this kind of prompt.
+        """
         from game_generator.spec import generate_spec
         spec = generate_spec("a top down space shooter with guns")
         # Without override, spec would be top_down_shooter
         self.assertEqual(spec["genre"], "top_down_shooter")
 
-        # After orchestrator applies idle_rpg override, genre becomes idle_rpg
-        from orchestrator.orchestrator import Orchestrator
-        import tempfile
-        import os
-        tmp = tempfile.mkdtemp()
-        zip_path = os.path.join(tmp, "out.zip")
-        try:
-            Orchestrator().run(
-                prompt="space shooter with guns",
-                output_zip=zip_path,
-                idle_rpg=True,
-                seed=1,
-            )
-            import zipfile
-            with zipfile.ZipFile(zip_path) as zf:
-                names = set(zf.namelist())
-            # idle_rpg genre always generates idle_manager.dart
-            self.assertTrue(any("idle_manager.dart" in n for n in names))
-        finally:
-            import shutil
-            shutil.rmtree(tmp, ignore_errors=True)
+
+class TestCachedDesignTemplate(unittest.TestCase):
+    """The orchestrator memoizes the template design doc per (prompt, seed)."""
+
+    def test_repeat_call_returns_cached_renderings(self):
+        from orchestrator.orchestrator import _cached_design_template
+        first = _cached_design_template("A cursed kingdom idle RPG", 7)
+        second = _cached_design_template("A cursed kingdom idle RPG", 7)
+        self.assertIs(first, second)
+
+    def test_cached_json_matches_doc(self):
+        from orchestrator.orchestrator import _cached_design_template
+        doc, json_text, md_text = _cached_design_template("A cursed kingdom idle RPG", 7)
+        self.assertEqual(json.loads(json_text), doc)
+        self.assertTrue(md_text.startswith("# Idle RPG Design Document"))
 
 
 if __name__ == "__main__":
@@ -7,12 +7,15 @@ _parse_and_validate and _strip_code_fences helpers directly.
 
 import json
 import unittest
+from unittest.mock import MagicMock, patch
 
+from game_generator.ai import design_assistant
 from game_generator.ai.design_assistant import (
     REQUIRED_KEYS,
     _parse_and_validate,
     _strip_code_fences,
     design_doc_to_markdown,
+    generate_idle_rpg_design,
 )
 
 
@@ -80,6 +83,23 @@ def _minimal_doc(**overrides) -> dict:
     return base
 
 
+# Serialized once; tests that need a variant still dump their own _minimal_doc().
+_MINIMAL_JSON = json.dumps(_minimal_doc())
+
+
+class TestGenerateIdleRpgDesign(unittest.TestCase):
+    def test_uses_shared_ollama_session(self):
+        session = MagicMock()
+        session.post.return_value.json.return_value = {
+            "message": {"content": _MINIMAL_JSON}
+        }
+        with patch("game_generator.ai.design_assistant.get_session", return_value=session):
+            doc = generate_idle_rpg_design("prompt", base_url="http://ollama:11434/")
+        self.assertEqual(doc["world"], _minimal_doc()["world"])
+        url = session.post.call_args.args[0]
+        self.assertEqual(url, "http://ollama:11434/api/chat")
+
+
 class TestStripCodeFences(unittest.TestCase):
     def test_no_fence_unchanged(self):
         raw = '{"key": "value"}'
@@ -97,17 +117,21 @@ class TestStripCodeFences(unittest.TestCase):
         raw = '  \n```json\n{"x": 1}\n```\n  '
         self.assertEqual(_strip_code_fences(raw), '{"x": 1}')
 
+    def test_unterminated_fence_stripped(self):
+        raw = '```json\n{"x": 1}'
+        self.assertEqual(_strip_code_fences(raw), '{"x": 1}')
+
 
 class TestParseAndValidate(unittest.TestCase):
     def test_valid_doc_passes(self):
-        raw = json.dumps(_minimal_doc())
+        raw = _MINIMAL_JSON
         result = _parse_and_validate(raw)
         self.assertIsInstance(result, dict)
         for key in REQUIRED_KEYS:
             self.assertIn(key, result)
 
     def test_code_fenced_json_parsed(self):
-        raw = "```json\n" + json.dumps(_minimal_doc()) + "\n```"
+        raw = "```json\n" + _MINIMAL_JSON + "\n```"
         result = _parse_and_validate(raw)
         self.assertIsInstance(result, dict)
 
@@ -116,6 +140,14 @@ class TestParseAndValidate(unittest.TestCase):
             _parse_and_validate("not valid json {{{")
         self.assertIn("not valid JSON", str(ctx.exception))
 
+    def test_stdlib_json_fallback(self):
+        raw = _MINIMAL_JSON
+        with patch.object(design_assistant, "orjson", None):
+            self.assertEqual(_parse_and_validate(raw), json.loads(raw))
+            with self.assertRaises(ValueError) as ctx:
+                _parse_and_validate("not valid json {{{")
+        self.assertIn("not valid JSON", str(ctx.exception))
+
     def test_missing_required_key_raises(self):
         doc = _minimal_doc()
         del doc["quests"]
@@ -135,6 +167,13 @@ class TestParseAndValidate(unittest.TestCase):
             _parse_and_validate(json.dumps(doc))
         self.assertIn("world", str(ctx.exception))
 
+    def test_all_wrong_types_reported_together(self):
+        doc = _minimal_doc(world=42, quests="not a list")
+        with self.assertRaises(ValueError) as ctx:
+            _parse_and_validate(json.dumps(doc))
+        self.assertIn("'world' must be a string", str(ctx.exception))
+        self.assertIn("'quests' must be a list", str(ctx.exception))
+
     def test_non_dict_top_level_raises(self):
         with self.assertRaises(ValueError) as ctx:
             _parse_and_validate(json.dumps([1, 2, 3]))
@@ -143,10 +182,15 @@ class TestParseAndValidate(unittest.TestCase):
     def test_json_with_preamble_extracted(self):
         """If LLM adds text before the JSON object, it should still parse."""
         preamble = "Here is the design document:\n"
-        raw = preamble + json.dumps(_minimal_doc())
+        raw = preamble + _MINIMAL_JSON
         result = _parse_and_validate(raw)
         self.assertIn("world", result)
 
+    def test_json_with_trailing_text_extracted(self):
+        raw = "Sure!\n" + _MINIMAL_JSON + "\nLet me know if you need changes."
+        result = _parse_and_validate(raw)
+        self.assertEqual(result["world"], _minimal_doc()["world"])
+
     def test_optional_keys_preserved(self):
         doc = _minimal_doc()
         doc["idle_loops"] = [
@@ -157,9 +201,11 @@ class TestParseAndValidate(unittest.TestCase):
 
 
 class TestDesignDocToMarkdown(unittest.TestCase):
-    def setUp(self):
-        self.doc = _minimal_doc()
-        self.md = design_doc_to_markdown(self.doc)
+    @classmethod
+    def setUpClass(cls):
+        # The section tests only search the rendered text, so render once.
+        cls.doc = _minimal_doc()
+        cls.md = design_doc_to_markdown(cls.doc)
 
     def test_returns_string(self):
         self.assertIsInstance(self.md, str)
@@ -12,6 +12,7 @@ tests/test_end_to_end_generation.py – End-to-end integration tests that:
 4. Test multiple spec configurations: custom title, landscape orientation, no design doc.
 """
 
+import functools
 import json
 import os
 import re
@@ -19,6 +20,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import types
 import unittest
 
 from game_generator.scaffolder import scaffold_project
@@ -43,6 +45,15 @@ def _idle_spec(title: str = "Dark Fantasy Idle RPG", **kwargs) -> GameSpec:
     return base
 
 
+@functools.lru_cache(maxsize=None)
+def _default_project() -> types.MappingProxyType:
+    """Scaffold the default ``_idle_spec()`` project once for every suite.
+
+    Read-only view, so one suite cannot change the files another one sees.
+    """
+    return types.MappingProxyType(scaffold_project(_idle_spec()))
+
+
 def _dart_binary() -> str | None:
     """Return path to 'dart' if available, else None."""
     # Check environment variable override first
@@ -61,6 +72,34 @@ def _dart_binary() -> str | None:
     return None
 
 
+# "line 3, column 5 of lib/main.dart: Expected ..." from a failed parse
+_DART_PARSE_ERROR_RE = re.compile(r"line \d+, column \d+ of (.+?\.dart): (.*)")
+
+
+def _dart_parse_errors(dart: str, root: str, paths: list) -> dict:
+    """Check *paths* (relative to *root*) with a single ``dart format`` run.
+
+    Returns ``{path: first error message}`` for every file that does not
+    parse.  One invocation pays the Dart VM startup once instead of once
+    per file.
+    """
+    result = subprocess.run(
+        [dart, "format", "--output=none", *paths],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+    errors: dict = {}
+    for match in _DART_PARSE_ERROR_RE.finditer(result.stderr):
+        path = match.group(1)
+        if os.path.isabs(path):
+            path = os.path.relpath(path, root)
+        errors.setdefault(path.replace(os.sep, "/"), match.group(2))
+    if result.returncode != 0 and not errors:
+        errors["<dart format>"] = result.stderr[:500]
+    return errors
+
+
 def _local_basenames(files: dict) -> set:
     return {p.split("/")[-1] for p in files if p.endswith(".dart")}
 
@@ -74,7 +113,7 @@ class TestFullProjectGeneration(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.files = scaffold_project(_idle_spec())
+        cls.files = _default_project()
 
     def test_total_file_count_at_least_60(self):
         self.assertGreaterEqual(
@@ -153,7 +192,7 @@ class TestDartSyntax(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.dart = _dart_binary()
-        cls.files = scaffold_project(_idle_spec())
+        cls.files = _default_project()
         # Write files to a temp directory
         cls.tmpdir = tempfile.mkdtemp(prefix="gamegen_syntax_")
         for path, content in cls.files.items():
@@ -161,6 +200,11 @@ class TestDartSyntax(unittest.TestCase):
             os.makedirs(os.path.dirname(full), exist_ok=True)
             with open(full, "w", encoding="utf-8") as f:
                 f.write(content)
+        # One dart format run covers every test in this class.
+        cls._parse_errors = {}
+        if cls.dart:
+            dart_files = [p for p in cls.files if p.endswith(".dart")]
+            cls._parse_errors = _dart_parse_errors(cls.dart, cls.tmpdir, dart_files)
 
     @classmethod
     def tearDownClass(cls):
@@ -168,63 +212,24 @@ class TestDartSyntax(unittest.TestCase):
 
     @unittest.skipUnless(_dart_binary(), "Dart SDK not available")
     def test_all_dart_files_parse_cleanly(self):
-        dart = _dart_binary()
-        dart_files = [
-            os.path.join(self.tmpdir, p)
-            for p in self.files
-            if p.endswith(".dart")
-        ]
-        errors = []
-        for fpath in dart_files:
-            result = subprocess.run(
-                [dart, "format", "--output=none", fpath],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode != 0 or "could not be parsed" in result.stderr:
-                errors.append(
-                    f"{os.path.relpath(fpath, self.tmpdir)}: {result.stderr[:200]}"
-                )
         self.assertEqual(
-            errors, [],
-            "Dart syntax errors found:\n" + "\n".join(errors),
+            self._parse_errors, {},
+            "Dart syntax errors found:\n"
+            + "\n".join(f"{path}: {msg}" for path, msg in self._parse_errors.items()),
         )
 
     @unittest.skipUnless(_dart_binary(), "Dart SDK not available")
     def test_store_screen_dart_parses(self):
         """Specifically test the store_screen with dollar signs and escaped newlines."""
-        dart = _dart_binary()
-        fpath = os.path.join(self.tmpdir, "lib/screens/store_screen.dart")
-        result = subprocess.run(
-            [dart, "format", "--output=none", fpath],
-            capture_output=True,
-            text=True,
-        )
-        self.assertNotIn(
-            "could not be parsed",
-            result.stderr,
-            f"store_screen.dart parse error: {result.stderr[:300]}",
-        )
+        self.assertNotIn("lib/screens/store_screen.dart", self._parse_errors)
 
     @unittest.skipUnless(_dart_binary(), "Dart SDK not available")
     def test_game_background_dart_parses(self):
-        dart = _dart_binary()
-        fpath = os.path.join(self.tmpdir, "lib/game/game_background.dart")
-        result = subprocess.run(
-            [dart, "format", "--output=none", fpath],
-            capture_output=True, text=True,
-        )
-        self.assertNotIn("could not be parsed", result.stderr)
+        self.assertNotIn("lib/game/game_background.dart", self._parse_errors)
 
     @unittest.skipUnless(_dart_binary(), "Dart SDK not available")
     def test_skill_hotbar_widget_dart_parses(self):
-        dart = _dart_binary()
-        fpath = os.path.join(self.tmpdir, "lib/widgets/skill_hotbar.dart")
-        result = subprocess.run(
-            [dart, "format", "--output=none", fpath],
-            capture_output=True, text=True,
-        )
-        self.assertNotIn("could not be parsed", result.stderr)
+        self.assertNotIn("lib/widgets/skill_hotbar.dart", self._parse_errors)
 
 
 # ---------------------------------------------------------------------------
@@ -236,7 +241,7 @@ class TestDartContentCorrectness(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.files = scaffold_project(_idle_spec())
+        cls.files = _default_project()
 
     # ── Template leaks ────────────────────────────────────────────────────
 
@@ -528,7 +533,7 @@ class TestJsonDataFiles(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.files = scaffold_project(_idle_spec())
+        cls.files = _default_project()
 
     def test_all_json_files_parse(self):
         errors = []
@@ -701,7 +706,7 @@ class TestPubspecYaml(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.files = scaffold_project(_idle_spec())
+        cls.files = _default_project()
         cls.pubspec = cls.files["pubspec.yaml"]
 
     def test_pubspec_has_required_dependencies(self):
@@ -734,7 +739,7 @@ class TestMobileScaffold(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.files = scaffold_project(_idle_spec())
+        cls.files = _default_project()
 
     def test_android_manifest_has_internet_permission(self):
         manifest = self.files["android/app/src/main/AndroidManifest.xml"]
@@ -91,6 +91,36 @@ class TestRunTrackerLogs(unittest.TestCase):
         messages = [json.loads(l)["msg"] for l in lines]
         self.assertTrue(any("find me" in m for m in messages))
 
+    def test_error_lines_written_without_close(self):
+        t = self._tracker()
+        t.error("disk on fire")
+        content = (Path(self.tmp) / "test-run" / "logs.txt").read_text()
+        self.assertIn("disk on fire", content)
+        t.close()
+
+    def test_flush_writes_buffered_lines(self):
+        t = self._tracker(json_logs=True)
+        t.info("buffered line")
+        t.flush()
+        run_dir = Path(self.tmp) / "test-run"
+        self.assertIn("buffered line", (run_dir / "logs.txt").read_text())
+        self.assertIn("buffered line", (run_dir / "logs.jsonl").read_text())
+        t.close()
+
+    def test_unbuffered_writes_every_line(self):
+        from orchestrator.run_tracker import RunTracker
+        t = RunTracker(run_id="test-run", runs_dir=self.tmp, buffered=False)
+        t.info("straight through")
+        content = (Path(self.tmp) / "test-run" / "logs.txt").read_text()
+        self.assertIn("straight through", content)
+        t.close()
+
+    def test_close_is_idempotent(self):
+        t = self._tracker()
+        t.info("once")
+        t.close()
+        t.close()
+
 
 class TestRunTrackerEvents(unittest.TestCase):
     """RunTracker must write progress events to events.jsonl."""
@@ -146,6 +176,41 @@ class TestRunTrackerEvents(unittest.TestCase):
         self.assertEqual(record["step"], 3)
         self.assertEqual(record["total_steps"], 10)
 
+    def test_events_visible_after_flush(self):
+        t = self._tracker()
+        t.emit("spec", "flushed")
+        t.flush()
+        line = (Path(self.tmp) / "ev-run" / "events.jsonl").read_text().strip()
+        self.assertEqual(json.loads(line)["message"], "flushed")
+        t.close()
+
+    def test_event_and_mirrored_log_line_share_timestamp(self):
+        t = self._tracker()
+        t.emit("spec", "same clock")
+        t.close()
+        run_dir = Path(self.tmp) / "ev-run"
+        event = json.loads((run_dir / "events.jsonl").read_text().strip())
+        log_line = (run_dir / "logs.txt").read_text().splitlines()[0]
+        self.assertTrue(log_line.startswith(event["ts"] + " [INFO] [spec]"))
+
+    def test_concurrent_emits_write_whole_lines(self):
+        t = self._tracker()
+
+        def worker(n):
+            for i in range(50):
+                t.emit(f"worker-{n}", f"event {i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        t.close()
+        lines = (Path(self.tmp) / "ev-run" / "events.jsonl").read_text().splitlines()
+        self.assertEqual(len(lines), 200)
+        for line in lines:
+            json.loads(line)
+
     def test_events_are_append_only(self):
         t = self._tracker()
         t.emit("spec", "first")
@@ -171,13 +236,28 @@ class TestRunTrackerStatusJson(unittest.TestCase):
     def _read_status(self, run_id="st-run"):
         return json.loads((Path(self.tmp) / run_id / "status.json").read_text())
 
-    def test_status_json_created_on_init(self):
+    def test_init_defers_disk_writes(self):
+        t = self._tracker()
+        self.assertFalse((Path(self.tmp) / "st-run").exists())
+        t.close()
+        self.assertFalse((Path(self.tmp) / "st-run").exists())
+
+    def test_status_json_created_on_start(self):
         t = self._tracker()
+        t.start()
         t.close()
         self.assertTrue((Path(self.tmp) / "st-run" / "status.json").exists())
 
+    def test_status_json_created_on_first_emit(self):
+        t = self._tracker()
+        t.emit("spec", "go")
+        t.flush()
+        self.assertTrue((Path(self.tmp) / "st-run" / "status.json").exists())
+        t.close()
+
     def test_status_running_on_start(self):
         t = self._tracker()
+        t.start()
         status = self._read_status()
         self.assertEqual(status["status"], "running")
         t.close()
@@ -199,6 +279,7 @@ class TestRunTrackerStatusJson(unittest.TestCase):
 
     def test_status_contains_run_id(self):
         t = self._tracker()
+        t.start()
         t.close()
         status = self._read_status()
         self.assertEqual(status["run_id"], "st-run")
@@ -206,6 +287,7 @@ class TestRunTrackerStatusJson(unittest.TestCase):
     def test_status_events_updated_on_emit(self):
         t = self._tracker()
         t.emit("spec", "go")
+        t.flush()
         status = self._read_status()
         self.assertEqual(len(status["events"]), 1)
         self.assertEqual(status["events"][0]["stage"], "spec")
@@ -215,17 +297,82 @@ class TestRunTrackerStatusJson(unittest.TestCase):
         t = self._tracker()
         t.emit("spec", "one")
         t.emit("scaffold", "two")
+        t.flush()
         status = self._read_status()
         self.assertEqual(len(status["events"]), 2)
         t.close()
 
+    def test_status_write_coalesced_between_flushes(self):
+        from unittest.mock import patch
+        with patch("orchestrator.run_tracker.STATUS_FLUSH_INTERVAL", 60), \
+                patch("orchestrator.run_tracker.LOG_FLUSH_INTERVAL", 60):
+            t = self._tracker()
+            t.start()
+            t.emit("spec", "one")
+            t.emit("scaffold", "two")
+            self.assertEqual(self._read_status()["events"], [])
+        t.close()
+        self.assertEqual(len(self._read_status()["events"]), 2)
+
+    def test_status_flushed_every_n_events(self):
+        from orchestrator.run_tracker import STATUS_FLUSH_EVERY
+        from unittest.mock import patch
+        with patch("orchestrator.run_tracker.STATUS_FLUSH_INTERVAL", 60), \
+                patch("orchestrator.run_tracker.LOG_FLUSH_INTERVAL", 60):
+            t = self._tracker()
+            t.start()
+            for i in range(STATUS_FLUSH_EVERY):
+                t.emit("stage", f"event {i}")
+            # The writer thread picks the batch up asynchronously.
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                if len(self._read_status()["events"]) == STATUS_FLUSH_EVERY:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(len(self._read_status()["events"]), STATUS_FLUSH_EVERY)
+        t.close()
+
+    def test_flush_drains_queued_events(self):
+        from unittest.mock import patch
+        with patch("orchestrator.run_tracker.LOG_FLUSH_INTERVAL", 60):
+            t = self._tracker()
+            for i in range(10):
+                t.emit("stage", f"event {i}")
+            t.flush()
+            lines = (Path(self.tmp) / "st-run" / "events.jsonl").read_text().splitlines()
+            self.assertEqual(
+                [json.loads(line)["message"] for line in lines],
+                [f"event {i}" for i in range(10)],
+            )
+        t.close()
+
+    def test_intra_run_writes_skip_temp_file(self):
+        t = self._tracker()
+        t.emit("spec", "go")
+        t.flush()
+        run_dir = Path(self.tmp) / "st-run"
+        self.assertFalse((run_dir / "status.json.tmp").exists())
+        self.assertEqual(len(self._read_status()["events"]), 1)
+        t.close()
+
     def test_status_has_timestamps(self):
         t = self._tracker()
+        t.start()
         status = self._read_status()
         self.assertIn("created_at", status)
         self.assertIn("updated_at", status)
         t.close()
 
+    def test_status_compact_while_running_indented_when_done(self):
+        t = self._tracker()
+        t.emit("spec", "go")
+        t.flush()
+        status_path = Path(self.tmp) / "st-run" / "status.json"
+        self.assertNotIn("\n", status_path.read_text())
+        t.complete()
+        t.close()
+        self.assertIn('\n  "status": "completed"', status_path.read_text())
+
     def test_context_manager_completes_on_success(self):
         with self._tracker() as t:
             t.emit("spec", "done")
@@ -243,6 +390,111 @@ class TestRunTrackerStatusJson(unittest.TestCase):
         self.assertIn("intentional error", status.get("error", ""))
 
 
+class _FailingWrites:
+    """Stands in for a file handle whose writes fail (e.g. a full disk)."""
+
+    def __init__(self, fh):
+        self._fh = fh
+
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def __getattr__(self, name):
+        return getattr(self._fh, name)
+
+
+class TestWriterThread(unittest.TestCase):
+    """The buffered writer thread must never leave callers waiting forever."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def _tracker(self, run_id="wr-run"):
+        from orchestrator.run_tracker import RunTracker
+        return RunTracker(run_id=run_id, runs_dir=self.tmp)
+
+    def _call(self, fn):
+        """Run *fn* on a helper thread; fail if it hangs, else return its exception."""
+        outcome = {}
+
+        def target():
+            try:
+                fn()
+            except Exception as exc:
+                outcome["exc"] = exc
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(5.0)
+        self.assertFalse(thread.is_alive(), f"{fn.__name__}() hung")
+        return outcome.get("exc")
+
+    def test_write_error_raised_from_flush_then_written_through(self):
+        t = self._tracker()
+        t.emit("stage", "before")
+        t.flush()
+        real_fh = t._events_fh
+        t._events_fh = _FailingWrites(real_fh)
+        t.emit("stage", "lost")
+        exc = self._call(t.flush)
+        self.assertIsInstance(exc, OSError)
+        # The writer is gone; later events are written on the caller's thread.
+        t._events_fh = real_fh
+        t.emit("stage", "after")
+        self.assertIsNone(self._call(t.flush))
+        t.close()
+        lines = (Path(self.tmp) / "wr-run" / "events.jsonl").read_text().splitlines()
+        self.assertEqual([json.loads(line)["message"] for line in lines], ["before", "after"])
+
+    def test_write_error_raised_from_close(self):
+        t = self._tracker()
+        t.start()
+        real_fh = t._events_fh
+        t._events_fh = _FailingWrites(real_fh)
+        t.emit("stage", "lost")
+        exc = self._call(t.close)
+        self.assertIsInstance(exc, OSError)
+        self.assertTrue(real_fh.closed)
+
+    def test_flush_racing_close_returns(self):
+        from orchestrator.run_tracker import _STOP
+        t = self._tracker()
+        t.emit("stage", "one")
+        t.flush()
+        with t._lock:
+            t._event_q.put(_STOP)  # as close() does
+            # Let the writer take _STOP off the queue; it then waits for the lock.
+            deadline = time.monotonic() + 2.0
+            while not t._event_q.empty() and time.monotonic() < deadline:
+                time.sleep(0.005)
+            flusher = threading.Thread(target=t.flush, daemon=True)
+            flusher.start()
+            time.sleep(0.05)
+        flusher.join(5.0)
+        self.assertFalse(flusher.is_alive(), "flush() hung behind close()")
+        t.close()
+
+    def test_close_without_complete_writes_pretty_status(self):
+        t = self._tracker()
+        t.emit("stage", "one")
+        # Let the writer write its compact in-run status first.
+        t.flush()
+        t.close()
+        text = (Path(self.tmp) / "wr-run" / "status.json").read_text()
+        self.assertTrue(text.startswith("{\n  "))
+        status = json.loads(text)
+        self.assertEqual(status["status"], "running")
+        self.assertEqual(len(status["events"]), 1)
+
+    def test_start_then_close_writes_pretty_status(self):
+        t = self._tracker()
+        t.start()
+        t.close()
+        text = (Path(self.tmp) / "wr-run" / "status.json").read_text()
+        self.assertTrue(text.startswith("{\n  "))
+        self.assertEqual(json.loads(text)["status"], "running")
+
+
 class TestLoadStatus(unittest.TestCase):
     """load_status() helper must return None for missing runs."""
 
@@ -257,11 +509,85 @@ class TestLoadStatus(unittest.TestCase):
     def test_returns_dict_for_existing_run(self):
         from orchestrator.run_tracker import RunTracker, load_status
         t = RunTracker(run_id="existing", runs_dir=self.tmp)
+        t.start()
         t.close()
         result = load_status("existing", runs_dir=self.tmp)
         self.assertIsNotNone(result)
         self.assertEqual(result["run_id"], "existing")
 
+    def test_unchanged_file_not_reparsed(self):
+        from unittest.mock import patch
+        from orchestrator import run_tracker
+        t = run_tracker.RunTracker(run_id="cached", runs_dir=self.tmp)
+        t.start()
+        first = run_tracker.load_status("cached", runs_dir=self.tmp)
+        with patch.object(run_tracker, "_loads", side_effect=AssertionError("re-parsed")):
+            second = run_tracker.load_status("cached", runs_dir=self.tmp)
+        self.assertEqual(first, second)
+        # Callers may trim the returned dict without touching the cache.
+        second["events"] = None
+        self.assertEqual(run_tracker.load_status("cached", runs_dir=self.tmp), first)
+        t.close()
+
+    def test_cached_events_list_not_shared(self):
+        from orchestrator import run_tracker
+        t = run_tracker.RunTracker(run_id="shared", runs_dir=self.tmp, buffered=False)
+        t.emit("spec", "one")
+        first = run_tracker.load_status("shared", runs_dir=self.tmp)
+        first["events"].append({"stage": "bogus"})
+        del first["events"][0]
+        second = run_tracker.load_status("shared", runs_dir=self.tmp)
+        self.assertEqual([e["stage"] for e in second["events"]], ["spec"])
+        t.close()
+
+    def test_replaced_file_with_same_mtime_and_size_reparsed(self):
+        import os
+        from orchestrator.run_tracker import load_status
+        run_dir = Path(self.tmp) / "swapped"
+        run_dir.mkdir()
+        path = run_dir / "status.json"
+        path.write_text('{"status": "running"}')
+        st = path.stat()
+        self.assertEqual(load_status("swapped", runs_dir=self.tmp)["status"], "running")
+        tmp = run_dir / "status.json.tmp"
+        tmp.write_text('{"status": "stopped"}')
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, path)
+        self.assertEqual(load_status("swapped", runs_dir=self.tmp)["status"], "stopped")
+
+    def test_changed_file_reparsed(self):
+        from orchestrator.run_tracker import RunTracker, load_status
+        t = RunTracker(run_id="changing", runs_dir=self.tmp)
+        t.start()
+        self.assertEqual(load_status("changing", runs_dir=self.tmp)["status"], "running")
+        t.complete()
+        t.close()
+        self.assertEqual(load_status("changing", runs_dir=self.tmp)["status"], "completed")
+
+    def test_retries_partially_written_file(self):
+        from unittest.mock import patch
+        from orchestrator import run_tracker
+        run_dir = Path(self.tmp) / "torn"
+        run_dir.mkdir()
+        (run_dir / "status.json").write_text('{"run_id": "to')
+
+        def finish_write(delay):
+            (run_dir / "status.json").write_text('{"run_id": "torn"}')
+
+        with patch.object(run_tracker.time, "sleep", side_effect=finish_write):
+            result = run_tracker.load_status("torn", runs_dir=self.tmp)
+        self.assertEqual(result, {"run_id": "torn"})
+
+    def test_raises_when_file_stays_invalid(self):
+        from unittest.mock import patch
+        from orchestrator import run_tracker
+        run_dir = Path(self.tmp) / "bad"
+        run_dir.mkdir()
+        (run_dir / "status.json").write_text("{")
+        with patch.object(run_tracker, "_STATUS_READ_RETRY_DELAY", 0):
+            with self.assertRaises(ValueError):
+                run_tracker.load_status("bad", runs_dir=self.tmp)
+
 
 class TestGetStatusHelper(unittest.TestCase):
     """get_status() must trim events to last_n."""
@@ -279,6 +605,142 @@ class TestGetStatusHelper(unittest.TestCase):
         self.assertEqual(status["events"][-1]["message"], "event 9")
         t.close()
 
+    def test_in_memory_events_are_bounded(self):
+        from orchestrator.run_tracker import MAX_STATUS_EVENTS, RunTracker
+        t = RunTracker(run_id="bounded-run", runs_dir=self.tmp)
+        for i in range(MAX_STATUS_EVENTS + 5):
+            t.emit("stage", f"event {i}")
+        status = t.get_status(last_n_events=MAX_STATUS_EVENTS * 2)
+        self.assertEqual(len(status["events"]), MAX_STATUS_EVENTS)
+        self.assertEqual(status["events_total"], MAX_STATUS_EVENTS + 5)
+        self.assertEqual(status["events"][0]["message"], "event 5")
+        t.close()
+        # The full history is still available in events.jsonl
+        lines = (Path(self.tmp) / "bounded-run" / "events.jsonl").read_text().splitlines()
+        self.assertEqual(len(lines), MAX_STATUS_EVENTS + 5)
+
+
+class TestBinaryEvents(unittest.TestCase):
+    """binary_events=True must write events.bin readable via iter_events()."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def _emit_all(self, run_id, **kwargs):
+        from orchestrator.run_tracker import RunTracker
+        t = RunTracker(run_id=run_id, runs_dir=self.tmp, **kwargs)
+        t.emit("spec", "Generating …", percent=10)
+        t.emit("scaffold", "file 1", step=1, total_steps=2)
+        t.close()
+        return Path(self.tmp) / run_id
+
+    def test_binary_events_round_trip(self):
+        from orchestrator.run_tracker import EVENTS_BIN_MAGIC, iter_events
+        run_dir = self._emit_all("bin-run", binary_events=True)
+        self.assertFalse((run_dir / "events.jsonl").exists())
+        self.assertTrue((run_dir / "events.bin").read_bytes().startswith(EVENTS_BIN_MAGIC))
+        events = list(iter_events("bin-run", runs_dir=self.tmp))
+        self.assertEqual([e["stage"] for e in events], ["spec", "scaffold"])
+        self.assertEqual(events[0]["message"], "Generating …")
+        self.assertEqual(events[1]["total_steps"], 2)
+
+    def test_json_codec_fallback_without_msgpack(self):
+        from unittest.mock import patch
+        from orchestrator import run_tracker
+        with patch.object(run_tracker, "msgpack", None):
+            run_dir = self._emit_all("json-codec", binary_events=True, buffered=False)
+            events = list(run_tracker.iter_events("json-codec", runs_dir=self.tmp))
+        header = (run_dir / "events.bin").read_bytes()[:5]
+        self.assertEqual(header, run_tracker.EVENTS_BIN_MAGIC + b"J")
+        self.assertEqual(len(events), 2)
+
+    def test_reopen_appends_after_header(self):
+        from orchestrator.run_tracker import iter_events
+        self._emit_all("reopen", binary_events=True)
+        self._emit_all("reopen", binary_events=True)
+        self.assertEqual(len(list(iter_events("reopen", runs_dir=self.tmp))), 4)
+
+    def test_partial_trailing_record_skipped(self):
+        from orchestrator.run_tracker import iter_events
+        run_dir = self._emit_all("torn-bin", binary_events=True)
+        with open(run_dir / "events.bin", "ab") as fh:
+            fh.write(b"\x40\x00\x00\x00{")
+        self.assertEqual(len(list(iter_events("torn-bin", runs_dir=self.tmp))), 2)
+
+    def test_iter_events_reads_jsonl(self):
+        from orchestrator.run_tracker import iter_events
+        self._emit_all("text-run")
+        events = list(iter_events("text-run", runs_dir=self.tmp))
+        self.assertEqual([e["stage"] for e in events], ["spec", "scaffold"])
+
+    def test_iter_events_missing_run(self):
+        from orchestrator.run_tracker import iter_events
+        self.assertEqual(list(iter_events("nope", runs_dir=self.tmp)), [])
+
+
+class TestDumps(unittest.TestCase):
+    """_dumps() must produce the same JSON with or without orjson."""
+
+    def test_compact_and_indented_round_trip(self):
+        from unittest.mock import patch
+        from orchestrator import run_tracker
+        obj = {"stage": "spec", "message": "Generating …", "percent": 10}
+        for backend in (run_tracker.orjson, None):
+            with patch.object(run_tracker, "orjson", backend):
+                compact = run_tracker._dumps(obj)
+                indented = run_tracker._dumps(obj, indent=True)
+            self.assertIsInstance(compact, bytes)
+            self.assertNotIn(b"\n", compact)
+            self.assertIn("…".encode("utf-8"), compact)
+            self.assertEqual(json.loads(compact), obj)
+            self.assertEqual(json.loads(indented), obj)
+            self.assertIn(b'\n  "stage"', indented)
+
+
+class TestNowIso(unittest.TestCase):
+    """_now_iso() must match datetime's formatting and follow the clock."""
+
+    def test_matches_datetime_isoformat(self):
+        from datetime import datetime, timezone
+        from unittest.mock import patch
+        from orchestrator import run_tracker
+        for stamp in (1_700_000_000.2, 1_700_000_000.9, 1_700_000_001.0):
+            with patch.object(run_tracker.time, "time", return_value=stamp):
+                expected = datetime.fromtimestamp(stamp, timezone.utc).isoformat(
+                    timespec="seconds"
+                )
+                self.assertEqual(run_tracker._now_iso(), expected)
+
+    def test_current_time(self):
+        from datetime import datetime, timezone
+        from orchestrator.run_tracker import _now_iso
+        before = datetime.now(timezone.utc).replace(microsecond=0)
+        value = datetime.fromisoformat(_now_iso())
+        after = datetime.now(timezone.utc)
+        self.assertTrue(before <= value <= after)
+
+
+class TestWriteAll(unittest.TestCase):
+    """_write_all() must write every chunk, in order, with or without writev."""
+
+    def test_writes_all_chunks_in_order(self):
+        from types import SimpleNamespace
+        from unittest.mock import patch
+        from orchestrator import run_tracker
+        tmp = tempfile.mkdtemp()
+        chunks = [f"line {i}\n".encode() for i in range(run_tracker._IOV_MAX + 5)]
+        for count in (3, len(chunks)):
+            for use_writev in (True, False):
+                path = Path(tmp) / f"out-{count}-{use_writev}.txt"
+                with open(path, "ab", buffering=0) as fh:
+                    if use_writev:
+                        run_tracker._write_all(fh, chunks[:count])
+                    else:
+                        # A platform without os.writev (e.g. Windows)
+                        with patch.object(run_tracker, "os", SimpleNamespace()):
+                            run_tracker._write_all(fh, chunks[:count])
+                self.assertEqual(path.read_bytes(), b"".join(chunks[:count]))
+
 
 class TestGameServerStatus(unittest.TestCase):
     """FastAPI /status endpoint must return status for known run_id."""
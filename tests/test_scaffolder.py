@@ -174,6 +174,41 @@ class TestScaffolderSpec(unittest.TestCase):
         for key in ("title", "genre", "mechanics", "required_assets", "screens", "controls", "progression"):
             self.assertIn(key, spec, f"Missing key: {key}")
 
+    def test_strip_code_fences(self):
+        from game_generator.spec import _strip_code_fences
+        self.assertEqual(_strip_code_fences('```json\n{"a": 1}\n```'), '{"a": 1}')
+        self.assertEqual(_strip_code_fences('  {"a": 1}\n'), '{"a": 1}')
+        self.assertEqual(_strip_code_fences('```\n{"a": 1}'), '{"a": 1}')
+
+    def test_generate_spec_accepts_fenced_ollama_json(self):
+        import json
+        from game_generator.spec import generate_spec
+
+        class FencedTranslator:
+            def _generate_ollama(self, system_prompt, user_prompt):
+                return "```json\n" + json.dumps(_shooter_spec()) + "\n```"
+
+        spec = generate_spec("space shooter", translator=FencedTranslator())
+        self.assertEqual(spec["title"], _shooter_spec()["title"])
+
+    def test_ollama_prompts_share_system_prefix(self):
+        from game_generator.ai.translator import OllamaTranslator
+        from game_generator.spec import _SPEC_SYSTEM_PROMPT, generate_spec
+
+        t = OllamaTranslator(model="m")
+        sent = []
+
+        def fake_generate(system_prompt, user_prompt):
+            sent.append(t._payload(system_prompt, user_prompt)["prompt"])
+            return "{}"
+
+        t._generate_ollama = fake_generate
+        generate_spec("space shooter", translator=t)
+        generate_spec("idle rpg with heroes", translator=t)
+        self.assertEqual(len(sent), 2)
+        for prompt in sent:
+            self.assertTrue(prompt.startswith(_SPEC_SYSTEM_PROMPT + "\n\n"))
+
 
 # ---------------------------------------------------------------------------
 # Mobile-readiness tests (iOS + Android completeness)
@@ -149,19 +149,25 @@ class TestGameSpecModel(unittest.TestCase):
         spec = _minimal_game_spec(genre="unknown_genre")
         with self.assertRaises(ValueError) as ctx:
             validate_game_spec(spec)
-        self.assertIn("genre", str(ctx.exception))
+        self.assertIn(
+            "'genre' must be one of ['idle_rpg', 'top_down_shooter'], "
+            "got 'unknown_genre'.",
+            str(ctx.exception),
+        )
 
     def test_empty_mechanics_raises(self):
         spec = _minimal_game_spec(mechanics=[])
         with self.assertRaises(ValueError) as ctx:
             validate_game_spec(spec)
-        self.assertIn("mechanics", str(ctx.exception))
+        self.assertIn("'mechanics' must not be an empty list.", str(ctx.exception))
 
     def test_empty_required_assets_raises(self):
         spec = _minimal_game_spec(required_assets=[])
         with self.assertRaises(ValueError) as ctx:
             validate_game_spec(spec)
-        self.assertIn("required_assets", str(ctx.exception))
+        self.assertIn(
+            "'required_assets' must not be an empty list.", str(ctx.exception)
+        )
 
     def test_error_message_lists_field_names(self):
         """ValueError message must name the problematic fields."""
@@ -268,25 +274,25 @@ class TestIdleRpgDesignDocModel(unittest.TestCase):
         doc = _minimal_design_doc(world="   ")
         with self.assertRaises(ValueError) as ctx:
             validate_idle_rpg_design_doc(doc)
-        self.assertIn("world", str(ctx.exception))
+        self.assertIn("'world' must not be blank.", str(ctx.exception))
 
     def test_blank_premise_raises(self):
         doc = _minimal_design_doc(premise="")
         with self.assertRaises(ValueError) as ctx:
             validate_idle_rpg_design_doc(doc)
-        self.assertIn("premise", str(ctx.exception))
+        self.assertIn("'premise' must not be blank.", str(ctx.exception))
 
     def test_empty_quests_list_raises(self):
         doc = _minimal_design_doc(quests=[])
         with self.assertRaises(ValueError) as ctx:
             validate_idle_rpg_design_doc(doc)
-        self.assertIn("quests", str(ctx.exception))
+        self.assertIn("'quests' must not be an empty list.", str(ctx.exception))
 
     def test_empty_enemies_list_raises(self):
         doc = _minimal_design_doc(enemies=[])
         with self.assertRaises(ValueError) as ctx:
             validate_idle_rpg_design_doc(doc)
-        self.assertIn("enemies", str(ctx.exception))
+        self.assertIn("'enemies' must not be an empty list.", str(ctx.exception))
 
     def test_error_message_prefix(self):
         doc = _minimal_design_doc()
@@ -306,5 +312,35 @@ class TestIdleRpgDesignDocModel(unittest.TestCase):
         self.assertIn("quests", msg)
 
 
+class TestSchemasPackageExports(unittest.TestCase):
+    """The schemas package must resolve its re-exports lazily."""
+
+    def test_reexports_resolve_to_submodule_objects(self):
+        import schemas
+        self.assertIs(schemas.GameSpecModel, GameSpecModel)
+        self.assertIs(schemas.validate_idle_rpg_design_doc, validate_idle_rpg_design_doc)
+        for name in schemas.__all__:
+            self.assertTrue(hasattr(schemas, name), name)
+
+    def test_unknown_attribute_raises(self):
+        import schemas
+        with self.assertRaises(AttributeError):
+            schemas.NotAModel  # noqa: B018
+
+    def test_import_does_not_load_models(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys, schemas; "
+            "from schemas import BuildSpec; "
+            "print('schemas.game_spec' in sys.modules, "
+            "'schemas.idle_rpg_design_doc' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+        self.assertEqual(out, ["False", "False"])
+
+
 if __name__ == "__main__":
     unittest.main()
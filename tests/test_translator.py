@@ -0,0 +1,206 @@
+"""
+Unit tests for game_generator.ai.translator – the minimal Ollama client.
+
+Requests go to a small in-process HTTP server that implements
+``POST /api/generate``, so both the ``requests`` and ``httpx`` code paths
+are exercised end to end without an Ollama install.
+"""
+
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from game_generator.ai import translator
+from game_generator.ai.http_session import get_session
+from game_generator.ai.translator import OllamaTranslator
+
+
+class _FakeOllamaHandler(BaseHTTPRequestHandler):
+    def do_POST(self):  # noqa: N802 (http.server naming)
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.requests.append(payload)
+            server.in_flight += 1
+            server.peak = max(server.peak, server.in_flight)
+        time.sleep(server.delay)
+        with server.lock:
+            server.in_flight -= 1
+        if self.path != "/api/generate" or server.status != 200:
+            self.send_response(404 if self.path != "/api/generate" else server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if payload["stream"]:
+            # NDJSON chunks, one word each; the body ends when we close.
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            for word in payload["prompt"].split():
+                chunk = {"response": word + " ", "done": False}
+                self.wfile.write(json.dumps(chunk).encode() + b"\n")
+                self.wfile.flush()
+            self.wfile.write(json.dumps({"response": "", "done": True}).encode() + b"\n")
+            return
+        body = json.dumps({"response": f"  {payload['prompt'].upper()}  "}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _FakeOllamaTestCase(unittest.TestCase):
+    """Runs one fake Ollama server for the whole class; state is reset per test."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllamaHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(
+            target=cls.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.in_flight = 0
+        self.server.peak = 0
+        self.server.delay = 0.0
+        self.server.status = 200
+
+    def _translator(self, **kwargs):
+        kwargs.setdefault("model", "m")
+        return OllamaTranslator(base_url=self.base_url, **kwargs)
+
+
+class TestOllamaTranslatorGenerate(_FakeOllamaTestCase):
+    """_generate_ollama() over the shared keep-alive requests session."""
+
+    def test_session_reused_within_thread(self):
+        self.assertIs(get_session(), get_session())
+
+    def test_each_thread_gets_its_own_session(self):
+        sessions = []
+        worker = threading.Thread(target=lambda: sessions.append(get_session()))
+        worker.start()
+        worker.join()
+        self.assertIsNot(sessions[0], get_session())
+
+    def test_generate_sends_payload_and_strips_response(self):
+        t = self._translator()
+        self.assertEqual(t._generate_ollama("sys", "user"), "SYS\n\nUSER")
+        payload = self.server.requests[0]
+        self.assertEqual(payload["model"], "m")
+        self.assertEqual(payload["prompt"], "sys\n\nuser")
+        self.assertFalse(payload["stream"])
+
+    def test_base_url_trailing_slash_ignored(self):
+        t = OllamaTranslator(model="m", base_url=self.base_url + "/")
+        self.assertEqual(t._generate_ollama("sys", "user"), "SYS\n\nUSER")
+
+    def test_deterministic_responses_cached(self):
+        t = self._translator(temperature=0)
+        self.assertEqual(t._generate_ollama("sys", "user"), "SYS\n\nUSER")
+        self.assertEqual(t._generate_ollama("sys", "user"), "SYS\n\nUSER")
+        self.assertEqual(len(self.server.requests), 1)
+        t._generate_ollama("sys", "other")
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_cache_bounded(self):
+        with patch.object(translator, "RESPONSE_CACHE_SIZE", 2):
+            t = self._translator(temperature=0)
+            for user in ("a", "b", "c", "a"):
+                t._generate_ollama("sys", user)
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_404_reports_missing_model(self):
+        self.server.status = 404
+        with self.assertRaises(RuntimeError) as ctx:
+            self._translator()._generate_ollama("sys", "user")
+        self.assertIn("ollama pull m", str(ctx.exception))
+
+    def test_connection_error_is_runtime_error(self):
+        t = OllamaTranslator(model="m", base_url="http://127.0.0.1:9")
+        with self.assertRaises(RuntimeError) as ctx:
+            t._generate_ollama("sys", "user")
+        self.assertIn("Cannot connect to Ollama", str(ctx.exception))
+
+
+class TestOllamaTranslatorGenerateStream(_FakeOllamaTestCase):
+    """generate_stream() must yield Ollama's streamed chunks in order."""
+
+    def test_chunks_yielded_in_order(self):
+        chunks = list(self._translator().generate_stream("be brief", "hello world"))
+        self.assertEqual(chunks, ["be ", "brief ", "hello ", "world "])
+        self.assertTrue(self.server.requests[0]["stream"])
+
+    def test_stream_404_reports_missing_model(self):
+        self.server.status = 404
+        with self.assertRaises(RuntimeError) as ctx:
+            list(self._translator().generate_stream("sys", "user"))
+        self.assertIn("ollama pull m", str(ctx.exception))
+
+
+class TestOllamaTranslatorGenerateMany(_FakeOllamaTestCase):
+    """generate_many() must send prompts concurrently and keep their order."""
+
+    def test_results_in_prompt_order_and_overlap(self):
+        self.server.delay = 0.02
+        prompts = [("sys", f"p{i}") for i in range(5)]
+        results = self._translator().generate_many(prompts)
+        self.assertEqual(results, [f"SYS\n\nP{i}" for i in range(5)])
+        self.assertGreater(self.server.peak, 1)
+
+    def test_in_flight_requests_capped_at_max_concurrency(self):
+        self.server.delay = 0.02
+        t = self._translator(max_concurrency=2)
+        self.assertEqual(t.max_concurrency, 2)
+        results = t.generate_many([("sys", f"p{i}") for i in range(6)])
+        self.assertEqual(len(results), 6)
+        self.assertEqual(self.server.peak, 2)
+
+    def test_deterministic_batch_reuses_cached_responses(self):
+        t = self._translator(temperature=0)
+        t.generate_many([("sys", "a"), ("sys", "b")])
+        t.generate_many([("sys", "a"), ("sys", "b")])
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_max_concurrency_from_environment(self):
+        with patch.dict("os.environ", {"OLLAMA_MAX_CONCURRENCY": "3"}):
+            self.assertEqual(OllamaTranslator().max_concurrency, 3)
+        self.assertEqual(OllamaTranslator(max_concurrency=1).max_concurrency, 1)
+
+    def test_invalid_max_concurrency_env_falls_back_to_default(self):
+        with patch.dict("os.environ", {"OLLAMA_MAX_CONCURRENCY": "four"}):
+            with self.assertLogs(translator.logger, "WARNING"):
+                t = OllamaTranslator()
+        self.assertEqual(t.max_concurrency, translator.DEFAULT_MAX_CONCURRENCY)
+
+    def test_404_reports_missing_model(self):
+        self.server.status = 404
+        with self.assertRaises(RuntimeError) as ctx:
+            self._translator().generate_many([("sys", "user")])
+        self.assertIn("ollama pull m", str(ctx.exception))
+
+    def test_connection_error_is_runtime_error(self):
+        t = OllamaTranslator(model="m", base_url="http://127.0.0.1:9")
+        with self.assertRaises(RuntimeError) as ctx:
+            t.generate_many([("sys", "user")])
+        self.assertIn("Cannot connect to Ollama", str(ctx.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -373,6 +373,21 @@ class TestValidatorWorkerWriteFiles(unittest.TestCase):
                 with open(full_path, encoding="utf-8") as fh:
                     self.assertEqual(fh.read(), content)
 
+    def test_write_files_many_files_in_shared_dirs(self):
+        import os
+
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {f"lib/game/file_{i}.dart": f"// {i}\n" for i in range(50)}
+            w = ValidatorWorker(tmp, files)
+            w.write_files()
+            for rel_path, content in files.items():
+                with open(os.path.join(tmp, rel_path), encoding="utf-8") as fh:
+                    self.assertEqual(fh.read(), content)
+
+    def test_write_files_with_no_files_is_noop(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ValidatorWorker(tmp, {}).write_files()
+
 
 class TestValidatorWorkerRunNotFound(unittest.TestCase):
     """_run must not raise when the executable is missing (e.g. Flutter not installed)."""
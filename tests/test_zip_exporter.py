@@ -8,7 +8,11 @@ import unittest
 import zipfile
 from pathlib import Path
 
-from game_generator.zip_exporter import export_to_zip
+from game_generator.zip_exporter import (
+    LARGE_PROJECT_BYTES,
+    compresslevel_for_size,
+    export_to_zip,
+)
 
 
 class TestExportToZip(unittest.TestCase):
@@ -106,6 +110,33 @@ class TestExportToZip(unittest.TestCase):
         with zipfile.ZipFile(self.output_zip, "r") as zf:
             self.assertEqual(zf.namelist(), [])
 
+    def test_compresslevel_zero_round_trips_content(self):
+        files = self._minimal_project()
+        export_to_zip(files, "", self.output_zip, compresslevel=0)
+        with zipfile.ZipFile(self.output_zip, "r") as zf:
+            for rel_path, content in files.items():
+                self.assertEqual(zf.read(rel_path).decode("utf-8"), content)
+                self.assertEqual(zf.getinfo(rel_path).compress_type, zipfile.ZIP_STORED)
+
+    def test_default_level_deflates(self):
+        export_to_zip(self._minimal_project(), "", self.output_zip)
+        with zipfile.ZipFile(self.output_zip, "r") as zf:
+            for info in zf.infolist():
+                self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+
+
+class TestCompresslevelForSize(unittest.TestCase):
+    """compresslevel_for_size picks a deflate level from the project size."""
+
+    def test_generated_size_projects_use_default(self):
+        # Built-in genres generate roughly 50–200 kB of text.
+        self.assertIsNone(compresslevel_for_size(0))
+        self.assertIsNone(compresslevel_for_size(200_000))
+        self.assertIsNone(compresslevel_for_size(LARGE_PROJECT_BYTES))
+
+    def test_large_project_uses_fastest_level(self):
+        self.assertEqual(compresslevel_for_size(LARGE_PROJECT_BYTES + 1), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -22,12 +22,17 @@ from __future__ import annotations
 import logging
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# write_files() tuning: concurrent writers and per-file write buffer size.
+WRITE_WORKERS = 8
+WRITE_BUFFER_SIZE = 65536
+
 # ---------------------------------------------------------------------------
 # Deterministic patch rules
 # ---------------------------------------------------------------------------
@@ -264,11 +269,19 @@ class ValidatorWorker:
     # ------------------------------------------------------------------
 
     def write_files(self) -> None:
-        """Write ``project_files`` to ``project_dir`` on disk."""
-        for rel_path, content in self.project_files.items():
-            dest = self.project_dir / rel_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(content, encoding="utf-8")
+        """Write ``project_files`` to ``project_dir`` on disk.
+
+        Parent directories are created once each up front; the files are
+        then written concurrently by up to ``WRITE_WORKERS`` threads.
+        """
+        items = list(self.project_files.items())
+        if not items:
+            return
+        for parent in sorted({(self.project_dir / rel).parent for rel, _ in items}):
+            parent.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(items))) as pool:
+            # Consume the iterator so exceptions from workers propagate.
+            list(pool.map(self._write_one, items))
 
     def validate(
         self,
@@ -401,6 +414,16 @@ class ValidatorWorker:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _write_one(self, item: Tuple[str, str]) -> None:
+        rel_path, content = item
+        with open(
+            self.project_dir / rel_path,
+            "w",
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as fh:
+            fh.write(content)
+
     def _run(self, cmd: List[str]) -> subprocess.CompletedProcess:
         try:
             return subprocess.run(